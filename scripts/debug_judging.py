@@ -4,18 +4,29 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-import operator
+import logging.handlers
 import os
+import queue
+import random
+import re
 import socket
 import sqlite3
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeout
 from contextlib import AbstractContextManager
+from contextvars import ContextVar, Token, copy_context
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from typing import Any, Callable, Optional
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from vozdipovo_app.db.migrate import ensure_schema
 from vozdipovo_app.judge import evaluate_article_significance
 from vozdipovo_app.settings import get_settings
@@ -35,29 +46,63 @@ def _iso(dt: datetime) -> str:
 
 
 def _safe_json(obj: Any, *, max_chars: int) -> str:
-    """Serializa em json e limita tamanho."""
+    """Serializa em json e limita o tamanho em bytes utf_8.
+
+    O corte é feito nos bytes e descarta um carácter multibyte incompleto
+    no fim, para que o limite valha para ficheiros e syslog.
+    """
+    b: Optional[bytes] = None
+    if orjson is not None:
+        try:
+            b = orjson.dumps(obj, default=str)
+        except Exception:
+            b = None
+    if b is None:
+        try:
+            s = json.dumps(obj, ensure_ascii=False, default=str)
+        except Exception:
+            s = str(obj)
+        b = s.encode("utf_8", errors="replace")
+    b = b.strip()
+    limit = int(max_chars)
+    if len(b) > limit:
+        return f"{b[:limit].decode('utf_8', errors='ignore')}…"
+    return b.decode("utf_8", errors="replace")
+
+
+def _json_len(obj: Any) -> int:
+    """Tamanho em bytes do json serializado, sem truncar."""
+    if orjson is not None:
+        try:
+            return len(orjson.dumps(obj, default=str))
+        except Exception:
+            pass
     try:
-        s = json.dumps(obj, ensure_ascii=False, default=str)
+        return len(json.dumps(obj, ensure_ascii=False, default=str).encode("utf_8"))
     except Exception:
-        s = str(obj)
-    s = str(s).strip()
-    if len(s) > int(max_chars):
-        return f"{s[: int(max_chars)]}…"
-    return s
+        return len(str(obj).encode("utf_8"))
+
+
+_SANITIZE_TABLE = str.maketrans({"`": "'", "\r": " ", "\n": " ", "-": "_"})
 
 
 def _sanitize_text(text: str) -> str:
     """Sanitiza texto para logs, substitui caracteres problemáticos."""
-    s = str(text or "")
-    return s.replace("`", "'").replace("\r", " ").replace("\n", " ").replace("-", "_")
+    return str(text or "").translate(_SANITIZE_TABLE)
 
 
-def run_with_timeout(fn: Callable[[], Any], timeout_seconds: int) -> Any:
+def run_with_timeout(
+    fn: Callable[[], Any], timeout_seconds: int, executor: ThreadPoolExecutor
+) -> Any:
     """Executa uma função com timeout duro.
 
+    O timeout só começa a contar quando a função arranca, o tempo em fila
+    no executor não conta.
+
     Args:
         fn: Função.
         timeout_seconds: Timeout em segundos.
+        executor: Executor onde a função corre.
 
     Returns:
         Resultado.
@@ -65,33 +110,43 @@ def run_with_timeout(fn: Callable[[], Any], timeout_seconds: int) -> Any:
     Raises:
         TimeoutError: Se exceder o tempo.
     """
-    with ThreadPoolExecutor(max_workers=1) as ex:
-        fut = ex.submit(fn)
-        try:
-            return fut.result(timeout=max(1, int(timeout_seconds)))
-        except FutureTimeout as e:
-            raise TimeoutError(f"Timeout após {timeout_seconds}s") from e
+    started = threading.Event()
 
+    def _call() -> Any:
+        started.set()
+        return fn()
 
+    fut = executor.submit(copy_context().run, _call)
+    started.wait()
+    try:
+        return fut.result(timeout=max(1, int(timeout_seconds)))
+    except FutureTimeout as e:
+        fut.cancel()
+        raise TimeoutError(f"Timeout após {timeout_seconds}s") from e
+
+
+_MODEL_ENDPOINT_NEEDLES = (
+    "openai",
+    "anthropic",
+    "cohere",
+    "mistral",
+    "groq",
+    "azure",
+    "generativelanguage",
+    "bedrock",
+    "ollama",
+    "v1/chat",
+    "v1/responses",
+    "v1/messages",
+    "v1/completions",
+)
+_MODEL_ENDPOINT_RE = re.compile("|".join(map(re.escape, _MODEL_ENDPOINT_NEEDLES)))
+
+
+@lru_cache(maxsize=4096)
 def _looks_like_model_endpoint(url: str) -> bool:
-    """Heurística para identificar endpoints de modelos."""
-    u = str(url or "").casefold()
-    needles = (
-        "openai",
-        "anthropic",
-        "cohere",
-        "mistral",
-        "groq",
-        "azure",
-        "generativelanguage",
-        "bedrock",
-        "ollama",
-        "v1/chat",
-        "v1/responses",
-        "v1/messages",
-        "v1/completions",
-    )
-    return any(n in u for n in needles)
+    """Heurística para identificar endpoints de modelos, memorizada por url."""
+    return _MODEL_ENDPOINT_RE.search(str(url or "").casefold()) is not None
 
 
 def _compact_prompt_from_json_payload(
@@ -124,6 +179,127 @@ def _compact_prompt_from_json_payload(
     return out
 
 
+_ACTIVE_TRACE: ContextVar[Optional["ModelHttpTrace"]] = ContextVar(
+    "model_http_trace", default=None
+)
+_PATCH_LOCK = threading.Lock()
+_PATCHED = False
+
+
+def _install_http_patches() -> None:
+    """Instala uma única vez os wrappers de httpx e requests.
+
+    Os wrappers delegam no trace ativo do contexto atual e chamam o original
+    diretamente quando não há trace ativo.
+    """
+    global _PATCHED
+    with _PATCH_LOCK:
+        if _PATCHED:
+            return
+        _patch_httpx()
+        _patch_requests()
+        _PATCHED = True
+
+
+def _patch_httpx() -> None:
+    try:
+        import httpx
+    except Exception:
+        return
+
+    orig_request = httpx.Client.request
+    orig_async_request = httpx.AsyncClient.request
+
+    def _client_request(client: Any, method: str, url: Any, **kwargs: Any) -> Any:
+        tr = _ACTIVE_TRACE.get()
+        if tr is None or not tr.recorded or not logger.isEnabledFor(logging.ERROR):
+            return orig_request(client, method, url, **kwargs)
+        url_s = str(url)
+        t0 = time.perf_counter()
+        tr._log_request("httpx", method, url_s, kwargs)
+        try:
+            resp = orig_request(client, method, url, **kwargs)
+            dt = time.perf_counter() - t0
+            tr._log_response("httpx", method, url_s, resp, dt)
+            return resp
+        except Exception as e:
+            dt = time.perf_counter() - t0
+            tr._log_error("httpx", method, url_s, e, dt)
+            raise
+
+    async def _async_client_request(
+        client: Any, method: str, url: Any, **kwargs: Any
+    ) -> Any:
+        tr = _ACTIVE_TRACE.get()
+        if tr is None or not tr.recorded or not logger.isEnabledFor(logging.ERROR):
+            return await orig_async_request(client, method, url, **kwargs)
+        url_s = str(url)
+        t0 = time.perf_counter()
+        tr._log_request("httpx_async", method, url_s, kwargs)
+        try:
+            resp = await orig_async_request(client, method, url, **kwargs)
+            dt = time.perf_counter() - t0
+            tr._log_response("httpx_async", method, url_s, resp, dt)
+            return resp
+        except Exception as e:
+            dt = time.perf_counter() - t0
+            tr._log_error("httpx_async", method, url_s, e, dt)
+            raise
+
+    httpx.Client.request = _client_request
+    httpx.AsyncClient.request = _async_client_request
+
+
+def _patch_requests() -> None:
+    try:
+        import requests
+    except Exception:
+        return
+
+    orig_request = requests.sessions.Session.request
+
+    def _session_request(session: Any, method: str, url: str, **kwargs: Any) -> Any:
+        tr = _ACTIVE_TRACE.get()
+        if tr is None:
+            return orig_request(session, method, url, **kwargs)
+        url_s = str(url)
+        t0 = time.perf_counter()
+
+        forced_timeout = tr._force_timeout(kwargs)
+        tr._log_request(
+            "requests",
+            method,
+            url_s,
+            kwargs,
+            forced_timeout=forced_timeout,
+        )
+
+        try:
+            resp = orig_request(session, method, url, **kwargs)
+            dt = time.perf_counter() - t0
+            tr._log_response("requests", method, url_s, resp, dt)
+            return resp
+        except Exception as e:
+            dt = time.perf_counter() - t0
+            tr._log_error("requests", method, url_s, e, dt)
+            raise
+
+    requests.sessions.Session.request = _session_request
+
+
+def _force_trace(correlation_id: str) -> bool:
+    """Indica se o id de correlação foi pedido em VOZDIPOVO_DEBUG_TRACE_ID.
+
+    Aceita uma lista separada por vírgulas, com o id completo
+    (legal_doc_id=123) ou só o valor (123).
+    """
+    raw = str(os.getenv("VOZDIPOVO_DEBUG_TRACE_ID", "") or "").strip()
+    if not raw:
+        return False
+    wanted = {w.strip() for w in raw.split(",") if w.strip()}
+    return correlation_id in wanted or correlation_id.partition("=")[2] in wanted
+
+
 class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
     """Trace de chamadas http para modelos, com timeout forçado."""
 
@@ -134,30 +310,37 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
         max_body_chars: int,
         force_connect_timeout: float,
         force_read_timeout: float,
+        sample_rate: float = 1.0,
     ) -> None:
         self._correlation_id = str(correlation_id)
         self._max_body_chars = int(max_body_chars)
         self._force_connect_timeout = float(force_connect_timeout)
         self._force_read_timeout = float(force_read_timeout)
-
-        self._httpx_client_request = None
-        self._httpx_async_client_request = None
-        self._requests_session_request = None
+        self._token: Optional[Token[Optional[ModelHttpTrace]]] = None
+        self._recorded = _force_trace(self._correlation_id) or (
+            random.random() < float(sample_rate)
+        )
 
     @property
     def correlation_id(self) -> str:
         """Id de correlação."""
         return self._correlation_id
 
+    @property
+    def recorded(self) -> bool:
+        """Se este trace foi amostrado para log."""
+        return self._recorded
+
     def __enter__(self) -> "ModelHttpTrace":
-        self._patch_httpx()
-        self._patch_requests()
+        _install_http_patches()
+        self._token = _ACTIVE_TRACE.set(self)
         logger.info(f"trace_on,corr={self._correlation_id}")
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        self._unpatch_httpx()
-        self._unpatch_requests()
+        if self._token is not None:
+            _ACTIVE_TRACE.reset(self._token)
+            self._token = None
         logger.info(f"trace_off,corr={self._correlation_id}")
 
     def _force_timeout(self, kwargs: dict[str, Any]) -> tuple[float, float]:
@@ -176,118 +359,6 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
         kwargs["timeout"] = forced
         return forced
 
-    def _patch_httpx(self) -> None:
-        try:
-            import httpx
-        except Exception:
-            return
-
-        if self._httpx_client_request is None:
-            self._httpx_client_request = httpx.Client.request
-
-            def _client_request(
-                client: Any, method: str, url: Any, **kwargs: Any
-            ) -> Any:
-                url_s = str(url)
-                t0 = time.perf_counter()
-                self._log_request("httpx", method, url_s, kwargs)
-                try:
-                    resp = self._httpx_client_request(client, method, url, **kwargs)
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_response("httpx", method, url_s, resp, dt)
-                    return resp
-                except Exception as e:
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_error("httpx", method, url_s, e, dt)
-                    raise
-
-            httpx.Client.request = _client_request
-
-        if self._httpx_async_client_request is None:
-            self._httpx_async_client_request = httpx.AsyncClient.request
-
-            async def _async_client_request(
-                client: Any, method: str, url: Any, **kwargs: Any
-            ) -> Any:
-                url_s = str(url)
-                t0 = time.perf_counter()
-                self._log_request("httpx_async", method, url_s, kwargs)
-                try:
-                    resp = await self._httpx_async_client_request(
-                        client, method, url, **kwargs
-                    )
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_response("httpx_async", method, url_s, resp, dt)
-                    return resp
-                except Exception as e:
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_error("httpx_async", method, url_s, e, dt)
-                    raise
-
-            httpx.AsyncClient.request = _async_client_request
-
-    def _unpatch_httpx(self) -> None:
-        try:
-            import httpx
-        except Exception:
-            return
-
-        if self._httpx_client_request is not None:
-            httpx.Client.request = self._httpx_client_request
-            self._httpx_client_request = None
-
-        if self._httpx_async_client_request is not None:
-            httpx.AsyncClient.request = self._httpx_async_client_request
-            self._httpx_async_client_request = None
-
-    def _patch_requests(self) -> None:
-        try:
-            import requests
-        except Exception:
-            return
-
-        if self._requests_session_request is None:
-            self._requests_session_request = requests.sessions.Session.request
-
-            def _session_request(
-                session: Any, method: str, url: str, **kwargs: Any
-            ) -> Any:
-                url_s = str(url)
-                t0 = time.perf_counter()
-
-                forced_timeout = self._force_timeout(kwargs)
-                self._log_request(
-                    "requests",
-                    method,
-                    url_s,
-                    kwargs,
-                    forced_timeout=forced_timeout,
-                )
-
-                try:
-                    resp = self._requests_session_request(
-                        session, method, url, **kwargs
-                    )
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_response("requests", method, url_s, resp, dt)
-                    return resp
-                except Exception as e:
-                    dt = operator.sub(time.perf_counter(), t0)
-                    self._log_error("requests", method, url_s, e, dt)
-                    raise
-
-            requests.sessions.Session.request = _session_request
-
-    def _unpatch_requests(self) -> None:
-        try:
-            import requests
-        except Exception:
-            return
-
-        if self._requests_session_request is not None:
-            requests.sessions.Session.request = self._requests_session_request
-            self._requests_session_request = None
-
     def _log_request(
         self,
         lib: str,
@@ -297,6 +368,8 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
         *,
         forced_timeout: Optional[tuple[float, float]] = None,
     ) -> None:
+        if not self._recorded or not logger.isEnabledFor(logging.INFO):
+            return
         if not _looks_like_model_endpoint(url):
             return
 
@@ -304,7 +377,7 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
             kwargs.get("headers") if isinstance(kwargs.get("headers"), dict) else {}
         )
         safe_headers = {
-            str(k): _sanitize_text(str(v))
+            str(k): str(v)
             for k, v in headers.items()
             if str(k).casefold()
             in ("content_type", "accept", "user_agent", "authorization")
@@ -321,9 +394,7 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
             "timeout": forced_timeout if forced_timeout else kwargs.get("timeout"),
             "headers": safe_headers,
             "json_summary": json_summary,
-            "json_len": len(_safe_json(json_payload, max_chars=self._max_body_chars))
-            if json_payload is not None
-            else 0,
+            "json_len": _json_len(json_payload) if json_payload is not None else 0,
         }
 
         logger.info(
@@ -332,8 +403,8 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
                     "event": "model_http_request",
                     "corr": self._correlation_id,
                     "lib": lib,
-                    "method": _sanitize_text(str(method)),
-                    "url": _sanitize_text(str(url)),
+                    "method": str(method),
+                    "url": str(url),
                     "payload": payload,
                 },
                 max_chars=self._max_body_chars,
@@ -343,6 +414,8 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
     def _log_response(
         self, lib: str, method: str, url: str, resp: Any, seconds: float
     ) -> None:
+        if not self._recorded or not logger.isEnabledFor(logging.INFO):
+            return
         if not _looks_like_model_endpoint(url):
             return
 
@@ -354,7 +427,7 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
         except Exception:
             body_text = None
 
-        body_s = _sanitize_text(body_text) if body_text else ""
+        body_s = body_text or ""
         body_head = body_s[: min(self._max_body_chars, 800)] if body_s else ""
 
         logger.info(
@@ -363,8 +436,8 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
                     "event": "model_http_response",
                     "corr": self._correlation_id,
                     "lib": lib,
-                    "method": _sanitize_text(str(method)),
-                    "url": _sanitize_text(str(url)),
+                    "method": str(method),
+                    "url": str(url),
                     "status": status,
                     "seconds": round(float(seconds), 3),
                     "body_len": len(body_s),
@@ -377,6 +450,8 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
     def _log_error(
         self, lib: str, method: str, url: str, err: Exception, seconds: float
     ) -> None:
+        if not self._recorded or not logger.isEnabledFor(logging.ERROR):
+            return
         if not _looks_like_model_endpoint(url):
             return
 
@@ -386,11 +461,11 @@ class ModelHttpTrace(AbstractContextManager["ModelHttpTrace"]):
                     "event": "model_http_error",
                     "corr": self._correlation_id,
                     "lib": lib,
-                    "method": _sanitize_text(str(method)),
-                    "url": _sanitize_text(str(url)),
+                    "method": str(method),
+                    "url": str(url),
                     "seconds": round(float(seconds), 3),
                     "error_type": type(err).__name__,
-                    "error": _sanitize_text(str(err)),
+                    "error": str(err),
                 },
                 max_chars=self._max_body_chars,
             ),
@@ -405,13 +480,17 @@ class DebugConfig:
     Attributes:
         limit: Quantos itens.
         timeout_seconds: Timeout por item.
-        throttle_seconds: Espera entre itens.
+        throttle_seconds: Intervalo mínimo entre arranques de itens.
         significance_threshold: Threshold.
         commit_every: Commit a cada N.
         trace_max_body_chars: Limite de logs.
         connect_timeout_seconds: Timeout de conexão.
         read_timeout_seconds: Timeout de leitura.
         socket_default_timeout_seconds: Timeout global de sockets.
+        trace_sample_rate: Fração de itens com trace http registado.
+        concurrency: Itens julgados em paralelo.
+        verbose_http: Se ativa logs DEBUG de urllib3 e requests.
+        skip_preflight: Se salta o preflight de DNS e TCP.
     """
 
     limit: int
@@ -423,6 +502,13 @@ class DebugConfig:
     connect_timeout_seconds: float
     read_timeout_seconds: float
     socket_default_timeout_seconds: float
+    trace_sample_rate: float
+    concurrency: int = 4
+    verbose_http: bool = False
+    skip_preflight: bool = False
+
+
+_SNIPPET_MAX_CHARS = 4000
 
 
 def _fetch_targets(conn: sqlite3.Connection, limit: int) -> list[sqlite3.Row]:
@@ -432,115 +518,152 @@ def _fetch_targets(conn: sqlite3.Connection, limit: int) -> list[sqlite3.Row]:
       ld.site_name,
       COALESCE(ld.title, '') AS title,
       COALESCE(ld.url, '') AS url,
-      COALESCE(ld.raw_payload_json, ld.content_text, ld.summary, ld.raw_html, '') AS snippet
+      substr(
+        COALESCE(ld.raw_payload_json, ld.content_text, ld.summary, ld.raw_html, ''),
+        1,
+        ?
+      ) AS snippet
     FROM legal_docs ld
     LEFT JOIN news_articles na ON na.legal_doc_id = ld.id
-    WHERE na.id IS NULL
-       OR na.review_status IN ('RETRY')
+    WHERE na.legal_doc_id IS NULL
+       OR na.review_status = 'RETRY'
     ORDER BY ld.id DESC
     LIMIT ?;
     """
-    return list(conn.execute(q, (int(limit),)).fetchall())
-
-
-def _upsert_retry(
-    conn: sqlite3.Connection,
+    return list(conn.execute(q, (_SNIPPET_MAX_CHARS, int(limit))).fetchall())
+
+
+_UPSERT_RETRY_SQL = """
+INSERT INTO news_articles (
+  legal_doc_id,
+  titulo,
+  review_status,
+  review_error,
+  review_error_kind,
+  review_http_status,
+  review_attempts,
+  review_next_retry_at,
+  updated_at,
+  created_at
+)
+VALUES (?, ?, 'RETRY', ?, ?, NULL, 1, ?, datetime('now'), datetime('now'))
+ON CONFLICT(legal_doc_id) DO UPDATE SET
+  review_status='RETRY',
+  review_error=excluded.review_error,
+  review_error_kind=excluded.review_error_kind,
+  review_attempts=COALESCE(news_articles.review_attempts, 0) + 1,
+  review_next_retry_at=excluded.review_next_retry_at,
+  updated_at=datetime('now');
+"""
+
+_UPSERT_JUDGED_SQL = """
+INSERT INTO news_articles (
+  legal_doc_id,
+  titulo,
+  final_score,
+  score_editorial,
+  judge_justification,
+  reviewed_by_model,
+  reviewed_at,
+  decision,
+  review_status,
+  review_attempts,
+  updated_at,
+  created_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'JUDGED', 1, datetime('now'), datetime('now'))
+ON CONFLICT(legal_doc_id) DO UPDATE SET
+  titulo=excluded.titulo,
+  final_score=excluded.final_score,
+  score_editorial=excluded.score_editorial,
+  judge_justification=excluded.judge_justification,
+  reviewed_by_model=excluded.reviewed_by_model,
+  reviewed_at=excluded.reviewed_at,
+  decision=excluded.decision,
+  review_status='JUDGED',
+  review_error=NULL,
+  review_error_kind=NULL,
+  review_http_status=NULL,
+  review_next_retry_at=NULL,
+  updated_at=datetime('now');
+"""
+
+
+def _retry_row(
     *,
     legal_doc_id: int,
     title: str,
     err: Exception,
     retry_after_seconds: int,
     error_kind: str,
-) -> None:
+) -> tuple[Any, ...]:
     next_retry = _iso(_utc_now() + timedelta(seconds=int(retry_after_seconds)))
-    conn.execute(
-        """
-        INSERT INTO news_articles (
-          legal_doc_id,
-          titulo,
-          review_status,
-          review_error,
-          review_error_kind,
-          review_http_status,
-          review_attempts,
-          review_next_retry_at,
-          updated_at,
-          created_at
-        )
-        VALUES (?, ?, 'RETRY', ?, ?, NULL, 1, ?, datetime('now'), datetime('now'))
-        ON CONFLICT(legal_doc_id) DO UPDATE SET
-          review_status='RETRY',
-          review_error=excluded.review_error,
-          review_error_kind=excluded.review_error_kind,
-          review_attempts=COALESCE(news_articles.review_attempts, 0) + 1,
-          review_next_retry_at=excluded.review_next_retry_at,
-          updated_at=datetime('now');
-        """,
-        (
-            int(legal_doc_id),
-            str(title),
-            _sanitize_text(str(err)),
-            str(error_kind),
-            str(next_retry),
-        ),
+    return (
+        int(legal_doc_id),
+        str(title),
+        str(err),
+        str(error_kind),
+        str(next_retry),
     )
 
 
-def _upsert_judged(
-    conn: sqlite3.Connection,
+def _judged_row(
     *,
     legal_doc_id: int,
     title: str,
     res: dict[str, Any],
     significance_threshold: float,
-) -> None:
+) -> tuple[Any, ...]:
     final_score = float(res.get("final_score") or 0.0)
     threshold = float(significance_threshold or 0.0)
     decision = "WRITE" if final_score >= threshold else "SKIP"
+    return (
+        int(legal_doc_id),
+        str(title),
+        float(final_score),
+        float(res.get("score_editorial") or 0.0),
+        str(res.get("judge_justification") or ""),
+        str(res.get("reviewed_by_model") or ""),
+        str(res.get("reviewed_at") or _iso(_utc_now())),
+        decision,
+    )
 
-    conn.execute(
-        """
-        INSERT INTO news_articles (
-          legal_doc_id,
-          titulo,
-          final_score,
-          score_editorial,
-          judge_justification,
-          reviewed_by_model,
-          reviewed_at,
-          decision,
-          review_status,
-          review_attempts,
-          updated_at,
-          created_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'JUDGED', 1, datetime('now'), datetime('now'))
-        ON CONFLICT(legal_doc_id) DO UPDATE SET
-          titulo=excluded.titulo,
-          final_score=excluded.final_score,
-          score_editorial=excluded.score_editorial,
-          judge_justification=excluded.judge_justification,
-          reviewed_by_model=excluded.reviewed_by_model,
-          reviewed_at=excluded.reviewed_at,
-          decision=excluded.decision,
-          review_status='JUDGED',
-          review_error=NULL,
-          review_error_kind=NULL,
-          review_http_status=NULL,
-          review_next_retry_at=NULL,
-          updated_at=datetime('now');
-        """,
-        (
-            int(legal_doc_id),
-            str(title),
-            float(final_score),
-            float(res.get("score_editorial") or 0.0),
-            _sanitize_text(str(res.get("judge_justification") or "")),
-            _sanitize_text(str(res.get("reviewed_by_model") or "")),
-            _sanitize_text(str(res.get("reviewed_at") or _iso(_utc_now()))),
-            decision,
-        ),
+
+def _flush_rows(
+    conn: sqlite3.Connection,
+    judged_rows: list[tuple[Any, ...]],
+    retry_rows: list[tuple[Any, ...]],
+) -> int:
+    """Grava os upserts pendentes numa única transação.
+
+    Args:
+        conn: Ligação SQLite.
+        judged_rows: Linhas julgadas pendentes, esvaziada no fim.
+        retry_rows: Linhas para retry pendentes, esvaziada no fim.
+
+    Returns:
+        Número de linhas gravadas.
+    """
+    n = len(judged_rows) + len(retry_rows)
+    if not n:
+        return 0
+    with conn:
+        if judged_rows:
+            conn.executemany(_UPSERT_JUDGED_SQL, judged_rows)
+        if retry_rows:
+            conn.executemany(_UPSERT_RETRY_SQL, retry_rows)
+    judged_rows.clear()
+    retry_rows.clear()
+    return n
+
+
+@lru_cache(maxsize=32)
+def _resolve_tcp(host: str, port: int) -> tuple[str, ...]:
+    """Resolve o host só em IPv4, com cache durante o processo."""
+    infos = socket.getaddrinfo(
+        host, port, socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP
     )
+    return tuple(str(i[4]) for i in infos)
 
 
 def _preflight_network(host: str, port: int, timeout_seconds: float) -> dict[str, Any]:
@@ -557,10 +680,10 @@ def _preflight_network(host: str, port: int, timeout_seconds: float) -> dict[str
     out: dict[str, Any] = {"host": host, "port": port}
     try:
         t0 = time.perf_counter()
-        infos = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
-        dt = operator.sub(time.perf_counter(), t0)
+        addrs = _resolve_tcp(host, int(port))
+        dt = time.perf_counter() - t0
         out["dns_seconds"] = round(float(dt), 3)
-        out["dns_results"] = [str(i[4]) for i in infos[:5]]
+        out["dns_results"] = list(addrs[:5])
     except Exception as e:
         out["dns_error"] = _sanitize_text(str(e))
         return out
@@ -569,7 +692,7 @@ def _preflight_network(host: str, port: int, timeout_seconds: float) -> dict[str
         t0 = time.perf_counter()
         s = socket.create_connection((host, port), timeout=timeout_seconds)
         s.close()
-        dt = operator.sub(time.perf_counter(), t0)
+        dt = time.perf_counter() - t0
         out["tcp_seconds"] = round(float(dt), 3)
         out["tcp_ok"] = True
     except Exception as e:
@@ -579,6 +702,25 @@ def _preflight_network(host: str, port: int, timeout_seconds: float) -> dict[str
     return out
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Passa a escrita dos logs deste script para uma thread dedicada.
+
+    O logger do script deixa de propagar para o root e envia os registos para
+    uma fila; um QueueListener entrega-os aos handlers do root.
+
+    Returns:
+        Listener já iniciado, a parar no fim do processo.
+    """
+    q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        q, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
 def _parse_args() -> DebugConfig:
     parser = argparse.ArgumentParser()
     parser.add_argument("--limit", type=int, default=1)
@@ -590,6 +732,10 @@ def _parse_args() -> DebugConfig:
     parser.add_argument("--connect-timeout-seconds", type=float, default=10.0)
     parser.add_argument("--read-timeout-seconds", type=float, default=45.0)
     parser.add_argument("--socket-default-timeout-seconds", type=float, default=30.0)
+    parser.add_argument("--trace-sample-rate", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--verbose-http", action="store_true")
+    parser.add_argument("--skip-preflight", action="store_true")
     ns = parser.parse_args()
 
     return DebugConfig(
@@ -602,17 +748,163 @@ def _parse_args() -> DebugConfig:
         connect_timeout_seconds=float(ns.connect_timeout_seconds),
         read_timeout_seconds=float(ns.read_timeout_seconds),
         socket_default_timeout_seconds=float(ns.socket_default_timeout_seconds),
+        trace_sample_rate=float(ns.trace_sample_rate),
+        concurrency=int(ns.concurrency),
+        verbose_http=bool(ns.verbose_http),
+        skip_preflight=bool(ns.skip_preflight),
     )
 
 
-def main() -> int:
-    logging.getLogger("urllib3").setLevel(logging.DEBUG)
-    logging.getLogger("requests").setLevel(logging.DEBUG)
-    socket.setdefaulttimeout(30.0)
+class _RateLimiter:
+    """Garante um intervalo mínimo entre arranques de pedidos, entre threads."""
 
-    cfg = _parse_args()
-    socket.setdefaulttimeout(float(cfg.socket_default_timeout_seconds))
+    def __init__(self, interval: float):
+        self._interval = max(0.0, float(interval))
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _judge_one(
+    cfg: DebugConfig,
+    timeout_pool: ThreadPoolExecutor,
+    limiter: _RateLimiter,
+    i: int,
+    r: sqlite3.Row,
+) -> tuple[str, tuple[Any, ...]]:
+    """Julga um item, corre numa thread do pool e não toca na base de dados.
+
+    Args:
+        cfg: Config do debug.
+        timeout_pool: Executor usado por run_with_timeout.
+        limiter: Limita o ritmo de arranque entre todas as threads.
+        i: Posição do item, a partir de 1.
+        r: Linha devolvida por _fetch_targets.
+
+    Returns:
+        Par (tipo, linha), com tipo judged ou retry, pronto para _flush_rows.
+    """
+    legal_doc_id = int(r["legal_doc_id"])
+    site_name = str(r["site_name"] or "")
+    title = str(r["title"] or "")
+    url = str(r["url"] or "")
+    snippet = str(r["snippet"] or "")
+    snippet_head = _sanitize_text(snippet[:400])
+
+    corr = f"legal_doc_id={legal_doc_id}"
+
+    limiter.wait()
+    logger.info(
+        _safe_json(
+            {
+                "event": "judge_start",
+                "i": i,
+                "corr": corr,
+                "site": _sanitize_text(site_name),
+                "title_len": len(title),
+                "url_len": len(url),
+                "snippet_len": len(snippet),
+                "snippet_head": snippet_head,
+                "timeout_seconds": cfg.timeout_seconds,
+                "connect_timeout_seconds": cfg.connect_timeout_seconds,
+                "read_timeout_seconds": cfg.read_timeout_seconds,
+            },
+            max_chars=cfg.trace_max_body_chars,
+        )
+    )
+
+    t0 = time.perf_counter()
+    out: tuple[str, tuple[Any, ...]]
+
+    try:
+        call = partial(
+            evaluate_article_significance,
+            title=title,
+            text_snippet=snippet,
+            source_name=site_name,
+            url=url,
+        )
+        with ModelHttpTrace(
+            correlation_id=corr,
+            max_body_chars=cfg.trace_max_body_chars,
+            force_connect_timeout=cfg.connect_timeout_seconds,
+            force_read_timeout=cfg.read_timeout_seconds,
+            sample_rate=cfg.trace_sample_rate,
+        ):
+            res = run_with_timeout(
+                call, timeout_seconds=cfg.timeout_seconds, executor=timeout_pool
+            )
+
+        dt = time.perf_counter() - t0
+
+        logger.info(
+            _safe_json(
+                {
+                    "event": "judge_done",
+                    "corr": corr,
+                    "seconds": round(float(dt), 3),
+                    "final_score": res.get("final_score"),
+                    "score_editorial": res.get("score_editorial"),
+                    "reviewed_by_model": _sanitize_text(
+                        str(res.get("reviewed_by_model") or "")
+                    ),
+                    "judge_justification_len": len(
+                        str(res.get("judge_justification") or "")
+                    ),
+                },
+                max_chars=cfg.trace_max_body_chars,
+            )
+        )
 
+        out = (
+            "judged",
+            _judged_row(
+                legal_doc_id=legal_doc_id,
+                title=title,
+                res=res,
+                significance_threshold=cfg.significance_threshold,
+            ),
+        )
+
+    except Exception as e:
+        dt = time.perf_counter() - t0
+        logger.error(
+            _safe_json(
+                {
+                    "event": "judge_fail",
+                    "corr": corr,
+                    "seconds": round(float(dt), 3),
+                    "error_type": type(e).__name__,
+                    "error": _sanitize_text(str(e)),
+                },
+                max_chars=cfg.trace_max_body_chars,
+            ),
+            exc_info=True,
+        )
+
+        kind = "timeout" if isinstance(e, TimeoutError) else "exception"
+        out = (
+            "retry",
+            _retry_row(
+                legal_doc_id=legal_doc_id,
+                title=title,
+                err=e,
+                retry_after_seconds=120,
+                error_kind=kind,
+            ),
+        )
+
+    return out
+
+
+def _run(cfg: DebugConfig) -> int:
     settings = get_settings()
     logger.info(f"db_path={settings.db_path}")
 
@@ -635,17 +927,28 @@ def main() -> int:
         )
     )
 
-    pre = _preflight_network(
-        "api.groq.com", 443, timeout_seconds=float(cfg.connect_timeout_seconds)
-    )
-    logger.info(
-        _safe_json(
-            {"event": "preflight", "result": pre}, max_chars=cfg.trace_max_body_chars
+    if not cfg.skip_preflight:
+        pre = _preflight_network(
+            "api.groq.com", 443, timeout_seconds=float(cfg.connect_timeout_seconds)
+        )
+        logger.info(
+            _safe_json(
+                {"event": "preflight", "result": pre},
+                max_chars=cfg.trace_max_body_chars,
+            )
         )
-    )
 
     conn = ensure_schema(str(settings.db_path))
     conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+        """
+    )
 
     try:
         rows = _fetch_targets(conn, cfg.limit)
@@ -655,120 +958,32 @@ def main() -> int:
 
         processed = 0
         commit_every = max(1, int(cfg.commit_every))
+        judged_rows: list[tuple[Any, ...]] = []
+        retry_rows: list[tuple[Any, ...]] = []
 
-        for i, r in enumerate(rows, start=1):
-            legal_doc_id = int(r["legal_doc_id"])
-            site_name = str(r["site_name"] or "")
-            title = str(r["title"] or "")
-            url = str(r["url"] or "")
-            snippet = str(r["snippet"] or "")
-            snippet_head = _sanitize_text(snippet[:400])
-
-            corr = f"legal_doc_id={legal_doc_id}"
-
-            logger.info(
-                _safe_json(
-                    {
-                        "event": "judge_start",
-                        "i": i,
-                        "corr": corr,
-                        "site": _sanitize_text(site_name),
-                        "title_len": len(title),
-                        "url_len": len(url),
-                        "snippet_len": len(snippet),
-                        "snippet_head": snippet_head,
-                        "timeout_seconds": cfg.timeout_seconds,
-                        "connect_timeout_seconds": cfg.connect_timeout_seconds,
-                        "read_timeout_seconds": cfg.read_timeout_seconds,
-                    },
-                    max_chars=cfg.trace_max_body_chars,
-                )
-            )
-
-            t0 = time.perf_counter()
-
-            try:
-
-                def _call() -> dict[str, Any]:
-                    return evaluate_article_significance(
-                        title=title,
-                        text_snippet=snippet[:4000],
-                        source_name=site_name,
-                        url=url,
-                    )
-
-                with ModelHttpTrace(
-                    correlation_id=corr,
-                    max_body_chars=cfg.trace_max_body_chars,
-                    force_connect_timeout=cfg.connect_timeout_seconds,
-                    force_read_timeout=cfg.read_timeout_seconds,
-                ):
-                    res = run_with_timeout(_call, timeout_seconds=cfg.timeout_seconds)
-
-                dt = operator.sub(time.perf_counter(), t0)
-
-                logger.info(
-                    _safe_json(
-                        {
-                            "event": "judge_done",
-                            "corr": corr,
-                            "seconds": round(float(dt), 3),
-                            "final_score": res.get("final_score"),
-                            "score_editorial": res.get("score_editorial"),
-                            "reviewed_by_model": _sanitize_text(
-                                str(res.get("reviewed_by_model") or "")
-                            ),
-                            "judge_justification_len": len(
-                                str(res.get("judge_justification") or "")
-                            ),
-                        },
-                        max_chars=cfg.trace_max_body_chars,
-                    )
-                )
-
-                _upsert_judged(
-                    conn,
-                    legal_doc_id=legal_doc_id,
-                    title=title,
-                    res=res,
-                    significance_threshold=cfg.significance_threshold,
-                )
-                processed += 1
-
-            except Exception as e:
-                dt = operator.sub(time.perf_counter(), t0)
-                logger.error(
-                    _safe_json(
-                        {
-                            "event": "judge_fail",
-                            "corr": corr,
-                            "seconds": round(float(dt), 3),
-                            "error_type": type(e).__name__,
-                            "error": _sanitize_text(str(e)),
-                        },
-                        max_chars=cfg.trace_max_body_chars,
-                    ),
-                    exc_info=True,
-                )
-
-                kind = "timeout" if isinstance(e, TimeoutError) else "exception"
-                _upsert_retry(
-                    conn,
-                    legal_doc_id=legal_doc_id,
-                    title=title,
-                    err=e,
-                    retry_after_seconds=120,
-                    error_kind=kind,
-                )
-
-            if processed > 0 and (processed % commit_every) == 0:
-                conn.commit()
-                logger.info(f"commit,processed={processed}")
-
-            if cfg.throttle_seconds:
-                time.sleep(float(cfg.throttle_seconds))
-
-        conn.commit()
+        workers = max(1, int(cfg.concurrency))
+        limiter = _RateLimiter(cfg.throttle_seconds)
+        timeout_pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="judge-timeout"
+        )
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="judge"
+            ) as pool:
+                judge = partial(_judge_one, cfg, timeout_pool, limiter)
+                for kind, row in pool.map(judge, range(1, len(rows) + 1), rows):
+                    if kind != "judged":
+                        retry_rows.append(row)
+                        continue
+                    judged_rows.append(row)
+                    processed += 1
+                    if processed % commit_every == 0:
+                        _flush_rows(conn, judged_rows, retry_rows)
+                        logger.info(f"commit,processed={processed}")
+        finally:
+            timeout_pool.shutdown(wait=False, cancel_futures=True)
+
+        _flush_rows(conn, judged_rows, retry_rows)
         logger.info(
             _safe_json(
                 {"event": "finished", "processed": processed},
@@ -781,5 +996,20 @@ def main() -> int:
         conn.close()
 
 
+def main() -> int:
+    cfg = _parse_args()
+    socket.setdefaulttimeout(float(cfg.socket_default_timeout_seconds))
+
+    http_level = logging.DEBUG if cfg.verbose_http else logging.WARNING
+    logging.getLogger("urllib3").setLevel(http_level)
+    logging.getLogger("requests").setLevel(http_level)
+
+    listener = _start_log_listener()
+    try:
+        return _run(cfg)
+    finally:
+        listener.stop()
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
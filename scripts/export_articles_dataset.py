@@ -5,9 +5,15 @@ import argparse
 import csv
 import json
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Iterable, Optional
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,221 +57,278 @@ class ExportRow:
     created_at: Optional[str]
     updated_at: Optional[str]
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "legal_doc_id": self.legal_doc_id,
-            "site_name": self.site_name,
-            "url": self.url,
-            "act_type": self.act_type,
-            "titulo": self.titulo,
-            "categoria_tematica": self.categoria_tematica,
-            "subcategoria": self.subcategoria,
-            "tags": self.tags,
-            "review_status": self.review_status,
-            "reviewed_at": self.reviewed_at,
-            "review_error": self.review_error,
-            "reviewed_by_model": self.reviewed_by_model,
-            "publishing_status": self.publishing_status,
-            "wp_post_id": self.wp_post_id,
-            "published_at": self.published_at,
-            "publishing_error": self.publishing_error,
-            "highlight_type": self.highlight_type,
-            "final_score": self.final_score,
-            "score_editorial": self.score_editorial,
-            "score_scale": self.score_scale,
-            "score_impact": self.score_impact,
-            "score_novelty": self.score_novelty,
-            "score_potential": self.score_potential,
-            "score_legacy": self.score_legacy,
-            "score_credibility": self.score_credibility,
-            "score_positivity": self.score_positivity,
-            "score_cv_relevance": self.score_cv_relevance,
-            "judge_model_used": self.judge_model_used,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+
+_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(ExportRow))
+_WRITE_BUFFER = 1 << 20
+_FETCH_SIZE = 2000
+# json.dumps com kwargs não-default cria um JSONEncoder novo em cada chamada
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+_EXPORT_SQL_WITH_JUDGE = """
+SELECT
+  na.legal_doc_id,
+  ld.site_name,
+  ld.url,
+  ld.act_type,
+  na.titulo,
+  na.categoria_tematica,
+  na.subcategoria,
+  na.tags,
+  na.review_status,
+  na.reviewed_at,
+  na.review_error,
+  na.reviewed_by_model,
+  na.publishing_status,
+  na.wp_post_id,
+  na.published_at,
+  na.publishing_error,
+  na.highlight_type,
+  na.final_score,
+  na.score_editorial,
+  na.score_scale,
+  na.score_impact,
+  na.score_novelty,
+  na.score_potential,
+  na.score_legacy,
+  na.score_credibility,
+  na.score_positivity,
+  na.score_cv_relevance,
+  (
+    SELECT json_extract(pl.details_json, '$.judge_model_used')
+    FROM pipeline_log pl
+    WHERE pl.legal_doc_id = na.legal_doc_id
+      AND pl.stage = 'judging'
+    ORDER BY pl.timestamp DESC, pl.log_id DESC
+    LIMIT 1
+  ) AS judge_model_used,
+  na.created_at,
+  na.updated_at
+FROM news_articles na
+JOIN legal_docs ld ON ld.id = na.legal_doc_id
+ORDER BY na.legal_doc_id DESC
+"""
+
+_EXPORT_SQL_PLAIN = """
+SELECT
+  na.legal_doc_id,
+  ld.site_name,
+  ld.url,
+  ld.act_type,
+  na.titulo,
+  na.categoria_tematica,
+  na.subcategoria,
+  na.tags,
+  na.review_status,
+  na.reviewed_at,
+  na.review_error,
+  na.reviewed_by_model,
+  na.publishing_status,
+  na.wp_post_id,
+  na.published_at,
+  na.publishing_error,
+  na.highlight_type,
+  na.final_score,
+  na.score_editorial,
+  na.score_scale,
+  na.score_impact,
+  na.score_novelty,
+  na.score_potential,
+  na.score_legacy,
+  na.score_credibility,
+  na.score_positivity,
+  na.score_cv_relevance,
+  NULL AS judge_model_used,
+  na.created_at,
+  na.updated_at
+FROM news_articles na
+JOIN legal_docs ld ON ld.id = na.legal_doc_id
+ORDER BY na.legal_doc_id DESC
+"""
 
 
 def _connect(db_path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA cache_size=-262144;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    if db_path != ":memory:":
+        conn.execute("PRAGMA mmap_size=1073741824;")
+    _ensure_judge_log_index(conn)
+    conn.execute("PRAGMA query_only=1;")
     return conn
 
 
-def _table_has_details(conn: sqlite3.Connection) -> bool:
+def _ensure_judge_log_index(conn: sqlite3.Connection) -> None:
+    if not _has_table(conn, "pipeline_log"):
+        return
+    try:
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_pipeline_log_judge
+            ON pipeline_log(legal_doc_id, stage, timestamp DESC, log_id DESC);
+            """
+        )
+        conn.commit()
+    except sqlite3.OperationalError:
+        pass
+
+
+def _has_table(conn: sqlite3.Connection, name: str) -> bool:
     row = conn.execute(
-        """
-        SELECT
-          SUM(CASE WHEN stage='judging' THEN 1 ELSE 0 END) AS total,
-          SUM(CASE WHEN stage='judging' AND details_json IS NOT NULL AND details_json != '' THEN 1 ELSE 0 END) AS with_details
-        FROM pipeline_log
-        """
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1;",
+        (name,),
     ).fetchone()
-    if not row:
-        return False
-    return int(row["with_details"] or 0) > 0
-
-
-def _iter_rows(conn: sqlite3.Connection) -> Iterable[ExportRow]:
-    has_judge_details = _table_has_details(conn)
-
-    if has_judge_details:
-        sql = """
-        WITH last_judge AS (
-          SELECT
-            pl.legal_doc_id,
-            pl.details_json,
-            pl.timestamp,
-            ROW_NUMBER() OVER (PARTITION BY pl.legal_doc_id ORDER BY pl.timestamp DESC, pl.log_id DESC) AS rn
-          FROM pipeline_log pl
-          WHERE pl.stage = 'judging'
-        )
-        SELECT
-          na.legal_doc_id,
-          ld.site_name,
-          ld.url,
-          ld.act_type,
-          na.titulo,
-          na.categoria_tematica,
-          na.subcategoria,
-          na.tags,
-          na.review_status,
-          na.reviewed_at,
-          na.review_error,
-          na.reviewed_by_model,
-          na.publishing_status,
-          na.wp_post_id,
-          na.published_at,
-          na.publishing_error,
-          na.highlight_type,
-          na.final_score,
-          na.score_editorial,
-          na.score_scale,
-          na.score_impact,
-          na.score_novelty,
-          na.score_potential,
-          na.score_legacy,
-          na.score_credibility,
-          na.score_positivity,
-          na.score_cv_relevance,
-          json_extract(lj.details_json, '$.judge_model_used') AS judge_model_used,
-          na.created_at,
-          na.updated_at
-        FROM news_articles na
-        JOIN legal_docs ld ON ld.id = na.legal_doc_id
-        LEFT JOIN last_judge lj ON lj.legal_doc_id = na.legal_doc_id AND lj.rn = 1
-        ORDER BY na.legal_doc_id DESC
-        """
+    return row is not None
+
+
+def _iter_values(conn: sqlite3.Connection) -> Iterable[tuple[Any, ...]]:
+    if _has_table(conn, "pipeline_log"):
+        sql = _EXPORT_SQL_WITH_JUDGE
     else:
-        sql = """
-        SELECT
-          na.legal_doc_id,
-          ld.site_name,
-          ld.url,
-          ld.act_type,
-          na.titulo,
-          na.categoria_tematica,
-          na.subcategoria,
-          na.tags,
-          na.review_status,
-          na.reviewed_at,
-          na.review_error,
-          na.reviewed_by_model,
-          na.publishing_status,
-          na.wp_post_id,
-          na.published_at,
-          na.publishing_error,
-          na.highlight_type,
-          na.final_score,
-          na.score_editorial,
-          na.score_scale,
-          na.score_impact,
-          na.score_novelty,
-          na.score_potential,
-          na.score_legacy,
-          na.score_credibility,
-          na.score_positivity,
-          na.score_cv_relevance,
-          NULL AS judge_model_used,
-          na.created_at,
-          na.updated_at
-        FROM news_articles na
-        JOIN legal_docs ld ON ld.id = na.legal_doc_id
-        ORDER BY na.legal_doc_id DESC
-        """
-
-    for r in conn.execute(sql):
-        yield ExportRow(
-            legal_doc_id=int(r["legal_doc_id"]),
-            site_name=r["site_name"],
-            url=r["url"],
-            act_type=r["act_type"],
-            titulo=r["titulo"],
-            categoria_tematica=r["categoria_tematica"],
-            subcategoria=r["subcategoria"],
-            tags=r["tags"],
-            review_status=r["review_status"],
-            reviewed_at=r["reviewed_at"],
-            review_error=r["review_error"],
-            reviewed_by_model=r["reviewed_by_model"],
-            publishing_status=r["publishing_status"],
-            wp_post_id=r["wp_post_id"],
-            published_at=r["published_at"],
-            publishing_error=r["publishing_error"],
-            highlight_type=r["highlight_type"],
-            final_score=_safe_float(r["final_score"]),
-            score_editorial=_safe_float(r["score_editorial"]),
-            score_scale=_safe_int(r["score_scale"]),
-            score_impact=_safe_int(r["score_impact"]),
-            score_novelty=_safe_int(r["score_novelty"]),
-            score_potential=_safe_int(r["score_potential"]),
-            score_legacy=_safe_int(r["score_legacy"]),
-            score_credibility=_safe_int(r["score_credibility"]),
-            score_positivity=_safe_int(r["score_positivity"]),
-            score_cv_relevance=_safe_int(r["score_cv_relevance"]),
-            judge_model_used=r["judge_model_used"],
-            created_at=r["created_at"],
-            updated_at=r["updated_at"],
-        )
+        sql = _EXPORT_SQL_PLAIN
+
+    cur = conn.execute(sql)
+    cur.arraysize = _FETCH_SIZE
+    while True:
+        chunk = cur.fetchmany()
+        if not chunk:
+            break
+        for (
+            legal_doc_id,
+            site_name,
+            url,
+            act_type,
+            titulo,
+            categoria_tematica,
+            subcategoria,
+            tags,
+            review_status,
+            reviewed_at,
+            review_error,
+            reviewed_by_model,
+            publishing_status,
+            wp_post_id,
+            published_at,
+            publishing_error,
+            highlight_type,
+            final_score,
+            score_editorial,
+            score_scale,
+            score_impact,
+            score_novelty,
+            score_potential,
+            score_legacy,
+            score_credibility,
+            score_positivity,
+            score_cv_relevance,
+            judge_model_used,
+            created_at,
+            updated_at,
+        ) in chunk:
+            yield (
+                int(legal_doc_id),
+                site_name,
+                url,
+                act_type,
+                titulo,
+                categoria_tematica,
+                subcategoria,
+                tags,
+                review_status,
+                reviewed_at,
+                review_error,
+                reviewed_by_model,
+                publishing_status,
+                wp_post_id,
+                published_at,
+                publishing_error,
+                highlight_type,
+                _safe_float(final_score),
+                _safe_float(score_editorial),
+                _safe_int(score_scale),
+                _safe_int(score_impact),
+                _safe_int(score_novelty),
+                _safe_int(score_potential),
+                _safe_int(score_legacy),
+                _safe_int(score_credibility),
+                _safe_int(score_positivity),
+                _safe_int(score_cv_relevance),
+                judge_model_used,
+                created_at,
+                updated_at,
+            )
 
 
 def _safe_int(v: Any) -> Optional[int]:
+    if v is None:
+        return None
+    if type(v) is int:
+        return v
     try:
-        if v is None:
-            return None
         return int(v)
     except Exception:
         return None
 
 
 def _safe_float(v: Any) -> Optional[float]:
+    if v is None:
+        return None
+    if type(v) is float:
+        return v
     try:
-        if v is None:
-            return None
         return float(v)
     except Exception:
         return None
 
 
-def _write_csv(path: Path, rows: Iterable[ExportRow]) -> None:
-    rows_list = list(rows)
-    if not rows_list:
+def _encode_jsonl(values: tuple[Any, ...]) -> bytes:
+    d = dict(zip(_FIELDS, values))
+    if orjson is not None:
+        return orjson.dumps(d) + b"\n"
+    return (_json_encode(d) + "\n").encode("utf-8")
+
+
+def _write_csv(path: Path, rows: Iterable[tuple[Any, ...]]) -> None:
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
         raise RuntimeError("Não há linhas para exportar.")
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(rows_list[0].to_dict().keys()))
-        w.writeheader()
-        for row in rows_list:
-            w.writerow(row.to_dict())
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+        w = csv.writer(f)
+        w.writerow(_FIELDS)
+        w.writerow(first)
+        w.writerows(it)
 
 
-def _write_jsonl(path: Path, rows: Iterable[ExportRow]) -> None:
+def _write_jsonl(path: Path, rows: Iterable[tuple[Any, ...]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row.to_dict(), ensure_ascii=False) + "\n")
+    with path.open("wb", buffering=_WRITE_BUFFER) as f:
+        for values in rows:
+            f.write(_encode_jsonl(values))
+
+
+def _write_both(
+    csv_path: Path, jsonl_path: Path, rows: Iterable[tuple[Any, ...]]
+) -> None:
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        raise RuntimeError("Não há linhas para exportar.")
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        csv_path.open(
+            "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER
+        ) as fc,
+        jsonl_path.open("wb", buffering=_WRITE_BUFFER) as fj,
+    ):
+        w = csv.writer(fc)
+        w.writerow(_FIELDS)
+        for values in chain((first,), it):
+            w.writerow(values)
+            fj.write(_encode_jsonl(values))
 
 
 def main() -> None:
@@ -278,15 +341,17 @@ def main() -> None:
     outdir = Path(args.outdir)
     conn = _connect(args.db)
     try:
-        rows = list(_iter_rows(conn))
+        if args.format == "both":
+            _write_both(
+                outdir / "articles.csv", outdir / "articles.jsonl", _iter_values(conn)
+            )
+        elif args.format == "csv":
+            _write_csv(outdir / "articles.csv", _iter_values(conn))
+        else:
+            _write_jsonl(outdir / "articles.jsonl", _iter_values(conn))
     finally:
         conn.close()
 
-    if args.format in ("csv", "both"):
-        _write_csv(outdir / "articles.csv", rows)
-    if args.format in ("jsonl", "both"):
-        _write_jsonl(outdir / "articles.jsonl", rows)
-
     print(f"✅ Export concluído: {outdir}/articles.csv e/ou {outdir}/articles.jsonl")
 
 
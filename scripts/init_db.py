@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 import os
-import sqlite3
 from pathlib import Path
 
-from vozdipovo_app.db.migrate import ensure_schema
+from vozdipovo_app.db.migrate import recreate_schema
 
 
 def _default_db_path() -> Path:
@@ -23,16 +22,8 @@ def main() -> None:
     db_path = Path(os.getenv("VOZDIPOVO_DB_PATH", str(_default_db_path()))).resolve()
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if db_path.exists():
-        db_path.unlink()
-
-    conn = sqlite3.connect(str(db_path), timeout=30)
-    try:
-        conn.row_factory = sqlite3.Row
-        ensure_schema(conn)
-        conn.commit()
-    finally:
-        conn.close()
+    conn = recreate_schema(str(db_path))
+    conn.close()
 
 
 if __name__ == "__main__":
@@ -8,10 +8,15 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from vozdipovo_app.settings import get_settings
-from vozdipovo_app.utils.logger import get_logger
-
-logger = get_logger(__name__, level="DEBUG")
+STAGE_MAP = {
+    "scraping": "vozdipovo_app.modules.scraping_stage.ScrapingStage",
+    "judging": "vozdipovo_app.modules.judging_stage.JudgingStage",
+    "generation": "vozdipovo_app.modules.generation_stage.GenerationStage",
+    "revision": "vozdipovo_app.modules.revision_stage.RevisionStage",
+    "publishing": "vozdipovo_app.modules.publishing_stage.PublishingStage",
+    "curation": "vozdipovo_app.modules.curation_stage.CurationStage",
+    "audio": "vozdipovo_app.modules.audio_stage.AudioStage",
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -35,6 +40,14 @@ def _origin(name: str) -> str:
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = _parse(argv)
+    dotted = STAGE_MAP.get(str(args.stage).lower())
+    if not dotted:
+        raise SystemExit(f"Stage inválido: {args.stage}")
+
+    from vozdipovo_app.settings import get_settings
+    from vozdipovo_app.utils.logger import get_logger
+
+    logger = get_logger(__name__, level="DEBUG")
 
     logger.info(f"Python={platform.python_version()}, exe={sys.executable}")
     logger.info(f"sys.path[0]={sys.path[0] if sys.path else ''}")
@@ -47,20 +60,6 @@ def main(argv: Optional[list[str]] = None) -> int:
     logger.info(f"configs_dir={settings.paths.configs_dir}")
     logger.info(f"sites_yaml={settings.app_cfg.get('paths', {}).get('sites')}")
 
-    stage_map = {
-        "scraping": "vozdipovo_app.modules.scraping_stage.ScrapingStage",
-        "judging": "vozdipovo_app.modules.judging_stage.JudgingStage",
-        "generation": "vozdipovo_app.modules.generation_stage.GenerationStage",
-        "revision": "vozdipovo_app.modules.revision_stage.RevisionStage",
-        "publishing": "vozdipovo_app.modules.publishing_stage.PublishingStage",
-        "curation": "vozdipovo_app.modules.curation_stage.CurationStage",
-        "audio": "vozdipovo_app.modules.audio_stage.AudioStage",
-    }
-
-    dotted = stage_map.get(str(args.stage).lower())
-    if not dotted:
-        raise SystemExit(f"Stage inválido: {args.stage}")
-
     mod_name, attr = dotted.rsplit(".", 1)
     logger.info(f"Import stage module={mod_name}, attr={attr}")
     mod = importlib.import_module(mod_name)
@@ -2,6 +2,7 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Adiciona o diretório src ao path para importar os módulos
 sys.path.insert(
@@ -9,18 +10,91 @@ sys.path.insert(
 )
 
 from vozdipovo_app.config import load_app_config
-from vozdipovo_app.wordpress.client import WPClient, WPConfig
-
+from vozdipovo_app.wordpress.client import WordPressError, WPClient, WPConfig
+
+# Também é o tamanho do pool HTTP, para cada worker reutilizar a sua ligação
+DELETE_WORKERS = 32
+PER_PAGE = 100
+# Limite por omissão de sub-pedidos do endpoint /batch/v1
+BATCH_SIZE = 25
+
+
+def batch_delete(client, route, ids):
+    """Apaga até BATCH_SIZE itens num único pedido a /batch/v1.
+
+    Devolve os IDs cujo sub-pedido não terminou com sucesso.
+    """
+    data = client.post(
+        "/wp-json/batch/v1",
+        json={
+            "requests": [
+                {"method": "DELETE", "path": f"{route}/{item_id}?force=true"}
+                for item_id in ids
+            ]
+        },
+    )
+    responses = (data or {}).get("responses") or []
+    failed = []
+    for i, item_id in enumerate(ids):
+        status = responses[i].get("status") if i < len(responses) else None
+        if not (isinstance(status, int) and 200 <= status < 300):
+            failed.append(item_id)
+    return failed
+
+
+def parallel_delete(pool, client, route, ids):
+    """Apaga os IDs com um DELETE por item, em paralelo. Devolve quantos apagou."""
+    futures = {
+        pool.submit(client.delete, f"/wp-json{route}/{item_id}?force=true"): item_id
+        for item_id in ids
+    }
+    ok = 0
+    for fut in as_completed(futures):
+        try:
+            fut.result()
+            ok += 1
+        except WordPressError as e:
+            print(f"   ❌ Falha ao apagar {futures[fut]}: {e}")
+    return ok
+
+
+def delete_all(client, list_path, route, describe):
+    """Apaga página a página, em blocos via /batch/v1 (WP 5.6+).
+
+    Se o endpoint de batch não estiver disponível, passa a apagar um a um em
+    paralelo; itens que falhem dentro de um batch também são repetidos assim.
+    Pára quando a listagem vem vazia ou quando nenhum item da página foi
+    apagado, para não ficar preso em itens que o servidor recusa.
+    """
+    deleted = 0
+    use_batch = True
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as pool:
+        while True:
+            items = client.get(list_path)
+            if not items:
+                break
 
-def get_json_data(response):
-    """Helper para extrair dados independentemente da versão do WPClient."""
-    # Se já for um dicionário ou lista, devolve direto
-    if isinstance(response, (dict, list)):
-        return response
-    # Se for um objeto Response do requests, extrai o .json()
-    if hasattr(response, "json"):
-        return response.json()
-    return response
+            for item in items:
+                print(describe(item))
+            ids = [item["id"] for item in items]
+
+            pending = []
+            for i in range(0, len(ids), BATCH_SIZE):
+                part = ids[i : i + BATCH_SIZE]
+                if use_batch:
+                    try:
+                        pending.extend(batch_delete(client, route, part))
+                        continue
+                    except WordPressError as e:
+                        print(f"   ⚠️  Batch indisponível, a apagar um a um: {e}")
+                        use_batch = False
+                pending.extend(part)
+
+            ok = len(ids) - len(pending) + parallel_delete(pool, client, route, pending)
+            deleted += ok
+            if ok == 0:
+                break
+    return deleted
 
 
 def reset_wordpress():
@@ -39,14 +113,14 @@ def reset_wordpress():
             base_url=cfg["wordpress"]["base_url"],
             username=cfg["wordpress"]["username"],
             app_password=cfg["wordpress"]["app_password"],
+            pool_maxsize=DELETE_WORKERS,
         )
         client = WPClient(wpcfg)
 
         # 1. Verificar identidade
         print("🔍 A verificar autenticação...")
         # O cliente atual lança exceção se falhar, por isso não precisamos ver status_code
-        me_response = client.get("/wp-json/wp/v2/users/me")
-        user_data = get_json_data(me_response)
+        user_data = client.get("/wp-json/wp/v2/users/me")
 
         author_id = user_data.get("id")
         if not author_id:
@@ -57,72 +131,43 @@ def reset_wordpress():
 
         # --- APAGAR POSTS ---
         print(f"\n🗑️  A apagar POSTS do utilizador {user_data.get('name')}...")
-        deleted_posts = 0
-        while True:
-            # Pede posts (status=any apanha rascunhos, publicados, lixo, etc.)
-            posts_response = client.get(
-                f"/wp-json/wp/v2/posts?author={author_id}&per_page=50&status=any"
-            )
-            posts_data = get_json_data(posts_response)
-
-            if not posts_data:
-                break
-
-            for post in posts_data:
-                pid = post["id"]
-                title = post.get("title", {}).get("rendered", "(sem título)")
-                print(f"   [Delete] Post {pid}: {title[:40]}...")
-
-                # force=true apaga permanentemente (ignora lixeira)
-                # Aqui usamos client.s (sessão) para ter acesso ao delete cru
-                client.s.delete(
-                    f"{wpcfg.base_url}/wp-json/wp/v2/posts/{pid}?force=true"
-                )
-                deleted_posts += 1
+        # status=any apanha rascunhos, publicados, lixo, etc.
+        # force=true apaga permanentemente (ignora lixeira)
+        deleted_posts = delete_all(
+            client,
+            f"/wp-json/wp/v2/posts?author={author_id}&per_page={PER_PAGE}&status=any",
+            "/wp/v2/posts",
+            lambda post: (
+                f"   [Delete] Post {post['id']}: "
+                f"{post.get('title', {}).get('rendered', '(sem título)')[:40]}..."
+            ),
+        )
 
         print(f"✅ Posts apagados: {deleted_posts}")
 
         # --- APAGAR MEDIA (IMAGENS) ---
         # Importante: Só apagamos media que pertença ao autor (bot) para não apagar logo do site inteiro
         print(f"\n🖼️  A apagar MEDIA/IMAGENS do utilizador {user_data.get('name')}...")
-        deleted_media = 0
-        while True:
-            media_response = client.get(
-                f"/wp-json/wp/v2/media?author={author_id}&per_page=50"
-            )
-            media_data = get_json_data(media_response)
-
-            if not media_data:
-                break
-
-            for item in media_data:
-                mid = item["id"]
-                slug = item.get("slug", str(mid))
-                print(f"   [Delete] Imagem {mid}: {slug}")
-
-                # force=true é essencial para apagar o ficheiro do disco do servidor
-                client.s.delete(
-                    f"{wpcfg.base_url}/wp-json/wp/v2/media/{mid}?force=true"
-                )
-                deleted_media += 1
+        # force=true é essencial para apagar o ficheiro do disco do servidor
+        deleted_media = delete_all(
+            client,
+            f"/wp-json/wp/v2/media?author={author_id}&per_page={PER_PAGE}",
+            "/wp/v2/media",
+            lambda item: (
+                f"   [Delete] Imagem {item['id']}: {item.get('slug', str(item['id']))}"
+            ),
+        )
 
         print(f"✅ Imagens apagadas: {deleted_media}")
 
         # --- APAGAR TAGS ---
         print("\n🏷️  A apagar TODAS as TAGS...")
-        deleted_tags = 0
-        while True:
-            tags_response = client.get("/wp-json/wp/v2/tags?per_page=50")
-            tags_data = get_json_data(tags_response)
-
-            if not tags_data:
-                break
-
-            for tag in tags_data:
-                tid = tag["id"]
-                print(f"   [Delete] Tag {tid}: {tag['name']}")
-                client.s.delete(f"{wpcfg.base_url}/wp-json/wp/v2/tags/{tid}?force=true")
-                deleted_tags += 1
+        deleted_tags = delete_all(
+            client,
+            f"/wp-json/wp/v2/tags?per_page={PER_PAGE}",
+            "/wp/v2/tags",
+            lambda tag: f"   [Delete] Tag {tag['id']}: {tag['name']}",
+        )
 
         print(f"✅ Tags apagadas: {deleted_tags}")
 
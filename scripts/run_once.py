@@ -18,14 +18,7 @@ from vozdipovo_app.config import load_app_config
 from vozdipovo_app.db.migrate import ensure_schema
 from vozdipovo_app.db.sqlite_conn import connect_sqlite
 from vozdipovo_app.editorial.config import get_editorial_config
-from vozdipovo_app.modules.audio_stage import AudioStage
 from vozdipovo_app.modules.base import StageContext
-from vozdipovo_app.modules.curation_stage import CurationStage
-from vozdipovo_app.modules.generation_stage import GenerationStage
-from vozdipovo_app.modules.judging_stage import JudgingStage
-from vozdipovo_app.modules.publishing_stage import PublishingStage
-from vozdipovo_app.modules.revision_stage import RevisionStage
-from vozdipovo_app.modules.scraping_stage import ScrapingStage
 
 
 def _sleep(seconds: float) -> None:
@@ -64,10 +57,14 @@ def main() -> None:
         ctx = StageContext(conn=conn, app_cfg=app_cfg, editorial=editorial)
 
         if args.stage in ("scraping", "full"):
+            from vozdipovo_app.modules.scraping_stage import ScrapingStage
+
             n = ScrapingStage(ctx).run()
             logger.info(f"✅ Scraping: scraped={n}")
 
         if args.stage in ("judging", "full"):
+            from vozdipovo_app.modules.judging_stage import JudgingStage
+
             lim = args.limit or int(editorial.pipeline.judge_limit_per_run)
             throttle = float(editorial.pipeline.throttle_seconds.judge)
             n = JudgingStage(ctx=ctx, limit=lim, throttle_seconds=throttle).run()
@@ -75,17 +72,23 @@ def main() -> None:
             _sleep(throttle)
 
         if args.stage in ("generation", "full"):
+            from vozdipovo_app.modules.generation_stage import GenerationStage
+
             lim = args.limit or int(editorial.pipeline.generate_limit_per_run)
             sig = float(editorial.scoring.significance_threshold)
             n = GenerationStage(ctx=ctx, significance_threshold=sig, limit=lim).run()
             logger.info(f"✅ Redação: generated={n}")
 
         if args.stage in ("revising", "full"):
+            from vozdipovo_app.modules.revision_stage import RevisionStage
+
             lim = args.limit or int(editorial.pipeline.revision_limit_per_run)
             n = RevisionStage(conn=conn, limit=lim).run()
             logger.info(f"✅ Reclassificação: updated={n}")
 
         if args.stage in ("publishing", "full"):
+            from vozdipovo_app.modules.publishing_stage import PublishingStage
+
             lim = args.limit or int(editorial.pipeline.publish_limit_per_run)
             throttle = float(editorial.pipeline.throttle_seconds.wordpress)
             n = PublishingStage(ctx=ctx, limit=lim, throttle_seconds=throttle).run()
@@ -93,6 +96,8 @@ def main() -> None:
             _sleep(throttle)
 
         if args.stage in ("curation", "full"):
+            from vozdipovo_app.modules.curation_stage import CurationStage
+
             hp = editorial.homepage
             n = CurationStage(
                 ctx=ctx,
@@ -107,6 +112,8 @@ def main() -> None:
             logger.info(f"✅ Curadoria: highlights={n}")
 
         if args.stage in ("audio", "full"):
+            from vozdipovo_app.modules.audio_stage import AudioStage
+
             a = editorial.audio
             highlight_types = set(a.highlights or ["BREAKING", "FEATURED"])
             n = AudioStage(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import sqlite3
 from pprint import pprint
 
-from vozdipovo_app.analytics.scoring_stats import compute_stats
+from vozdipovo_app.analytics.scoring_stats import compute_stats_many
 
 DB = "configs/vozdipovo.db"
 COLUMNS = [
@@ -21,9 +21,10 @@ COLUMNS = [
 
 conn = sqlite3.connect(DB)
 conn.row_factory = sqlite3.Row
+conn.execute("PRAGMA cache_size=-262144;")
+conn.execute("PRAGMA mmap_size=1073741824;")
 
-for col in COLUMNS:
-    stats = compute_stats(conn, col)
+for col, stats in compute_stats_many(conn, COLUMNS).items():
     print(f"\n📊 {col}")
     pprint(stats)
 
@@ -3,8 +3,16 @@ from __future__ import annotations
 
 import argparse
 import sqlite3
+from array import array
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+_FETCH_SIZE = 10_000
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,19 +31,29 @@ def _connect(db_path: str) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA cache_size=-262144;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    if db_path != ":memory:":
+        conn.execute("PRAGMA mmap_size=1073741824;")
     return conn
 
 
-def _col_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.arraysize = _FETCH_SIZE
+    return cur
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> frozenset[str]:
     rows = conn.execute(f"PRAGMA table_info({table});").fetchall()
-    return any(str(r["name"]).lower() == column.lower() for r in rows)
+    return frozenset(str(r["name"]).lower() for r in rows)
 
 
-def _pick_score_column(
-    conn: sqlite3.Connection, candidates: List[str]
-) -> Optional[str]:
+def _pick_score_column(columns: frozenset[str], candidates: List[str]) -> Optional[str]:
     for c in candidates:
-        if _col_exists(conn, "news_articles", c):
+        if c.lower() in columns:
             return c
     return None
 
@@ -54,9 +72,28 @@ def _percentile(sorted_vals: List[float], p: float) -> float:
     return float(sorted_vals[lo] * (1 - frac) + sorted_vals[hi] * frac)
 
 
-def _stats(vals: List[float]) -> ScoreStats:
-    vals = [float(v) for v in vals if v is not None]
-    vals.sort()
+def _np_stats(vals: Sequence[float]) -> ScoreStats:
+    arr = np.asarray(vals, dtype=np.float64)
+    if not arr.size:
+        return ScoreStats(
+            count=0, avg=0.0, median=0.0, p75=0.0, p90=0.0, min=0.0, max=0.0
+        )
+    median, p75, p90 = np.quantile(arr, (0.5, 0.75, 0.9))
+    return ScoreStats(
+        count=int(arr.size),
+        avg=round(float(arr.mean()), 3),
+        median=round(float(median), 2),
+        p75=round(float(p75), 2),
+        p90=round(float(p90), 2),
+        min=round(float(arr.min()), 2),
+        max=round(float(arr.max()), 2),
+    )
+
+
+def _stats(vals: Sequence[float]) -> ScoreStats:
+    if np is not None:
+        return _np_stats(vals)
+    vals = sorted(vals)
     if not vals:
         return ScoreStats(
             count=0, avg=0.0, median=0.0, p75=0.0, p90=0.0, min=0.0, max=0.0
@@ -77,15 +114,171 @@ def _stats(vals: List[float]) -> ScoreStats:
     )
 
 
-def _fetch_vals(
+def _fetch_columns(
+    conn: sqlite3.Connection,
+    cols: List[str],
+    where: str,
+) -> List[array]:
+    """Lê todas as colunas de score numa única passagem pela tabela.
+
+    Args:
+        conn: Ligação SQLite.
+        cols: Colunas de score a ler.
+        where: Filtro do scope.
+
+    Returns:
+        List[array]: Valores não nulos de cada coluna, pela ordem de cols.
+    """
+    q = f"SELECT {', '.join(cols)} FROM news_articles na JOIN legal_docs ld ON ld.id=na.legal_doc_id WHERE {where}"
+    cur = _tuple_cursor(conn)
+    cur.execute(q)
+    buffers = [array("d") for _ in cols]
+    appends = [b.append for b in buffers]
+    while rows := cur.fetchmany():
+        for row in rows:
+            for append, v in zip(appends, row):
+                if v is not None:
+                    append(v)
+    return buffers
+
+
+_PCTS = (0.5, 0.75, 0.9)
+
+
+def _pct_columns(v: str = "v", r: str = "r", m: str = "m") -> str:
+    return ",\n  ".join(
+        f"MAX(CASE WHEN {r} = CAST({m} * {p} AS INT) THEN {v} END), "
+        f"MAX(CASE WHEN {r} = MIN(CAST({m} * {p} AS INT) + 1, {m}) THEN {v} END)"
+        for p in _PCTS
+    )
+
+
+_PCT_COLUMNS = _pct_columns()
+# ROW_NUMBER()/COUNT(*) OVER exigem SQLite >= 3.25
+_HAS_WINDOW = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+
+def _stats_from_row(row: Tuple[Any, ...]) -> ScoreStats:
+    """Constrói ScoreStats a partir de COUNT, AVG, MIN, MAX e pares lo/hi.
+
+    Args:
+        row: Linha agregada, com os valores vizinhos de cada percentil.
+
+    Returns:
+        ScoreStats: Estatísticas com a mesma interpolação de _percentile.
+    """
+    count = int(row[0] or 0)
+    if not count:
+        return ScoreStats(
+            count=0, avg=0.0, median=0.0, p75=0.0, p90=0.0, min=0.0, max=0.0
+        )
+    pct = []
+    for i, p in enumerate(_PCTS):
+        lo_v, hi_v = float(row[4 + 2 * i]), float(row[5 + 2 * i])
+        idx = (count - 1) * p
+        frac = idx - int(idx)
+        pct.append(lo_v * (1 - frac) + hi_v * frac)
+    return ScoreStats(
+        count=count,
+        avg=round(float(row[1]), 3),
+        median=round(pct[0], 2),
+        p75=round(pct[1], 2),
+        p90=round(pct[2], 2),
+        min=round(float(row[2]), 2),
+        max=round(float(row[3]), 2),
+    )
+
+
+def _ranked_cte(col: str, where: str, group_col: str = "NULL") -> str:
+    return f"""
+WITH s AS (
+  SELECT
+    g,
+    v,
+    seq,
+    ROW_NUMBER() OVER (PARTITION BY g ORDER BY v) - 1 AS r,
+    COUNT(*) OVER (PARTITION BY g) - 1 AS m
+  FROM (
+    SELECT
+      {group_col} AS g,
+      CAST({col} AS REAL) AS v,
+      ROW_NUMBER() OVER () AS seq
+    FROM news_articles na
+    JOIN legal_docs ld ON ld.id = na.legal_doc_id
+    WHERE {where}
+      AND {col} IS NOT NULL
+  )
+)
+"""
+
+
+def _sql_stats(
+    conn: sqlite3.Connection, cols: List[str], where: str
+) -> List[ScoreStats]:
+    """Calcula as estatísticas de várias colunas numa única consulta SQLite.
+
+    Args:
+        conn: Ligação SQLite.
+        cols: Colunas de score.
+        where: Filtro do scope.
+
+    Returns:
+        List[ScoreStats]: Estatísticas de cada coluna, pela ordem de cols.
+    """
+    base = ", ".join(f"CAST({c} AS REAL) AS v{i}" for i, c in enumerate(cols))
+    ranked = ",\n    ".join(
+        f"v{i}, ROW_NUMBER() OVER (PARTITION BY v{i} IS NULL ORDER BY v{i}) - 1"
+        f" AS r{i}, COUNT(v{i}) OVER () - 1 AS m{i}"
+        for i in range(len(cols))
+    )
+    aggregates = ",\n  ".join(
+        f"COUNT(v{i}), AVG(v{i}), MIN(v{i}), MAX(v{i}),\n  "
+        + _pct_columns(f"v{i}", f"r{i}", f"m{i}")
+        for i in range(len(cols))
+    )
+    q = f"""
+WITH s AS (
+  SELECT
+    {ranked}
+  FROM (
+    SELECT {base}
+    FROM news_articles na
+    JOIN legal_docs ld ON ld.id = na.legal_doc_id
+    WHERE {where}
+  )
+)
+SELECT
+  {aggregates}
+FROM s
+"""
+    row = conn.execute(q).fetchone()
+    width = 4 + 2 * len(_PCTS)
+    return [_stats_from_row(row[i * width : (i + 1) * width]) for i in range(len(cols))]
+
+
+def _sql_group_stats(
     conn: sqlite3.Connection,
     col: str,
+    group_col: str,
     where: str,
-    params: Tuple[Any, ...],
-) -> List[float]:
-    q = f"SELECT {col} AS v FROM news_articles na JOIN legal_docs ld ON ld.id=na.legal_doc_id WHERE {where} AND {col} IS NOT NULL"
+) -> List[Tuple[str, ScoreStats]]:
+    # Empates na contagem ficam pela ordem de aparição, como no sort estável
+    # do fallback. O AVG do SQLite pode diferir na 3.ª casa de sum()/count.
+    q = f"""{_ranked_cte(col, where, group_col)}
+SELECT
+  COUNT(*),
+  AVG(v),
+  MIN(v),
+  MAX(v),
+  {_PCT_COLUMNS},
+  g
+FROM s
+GROUP BY g
+ORDER BY COUNT(*) DESC, MIN(seq)
+"""
     return [
-        float(r["v"]) for r in conn.execute(q, params).fetchall() if r["v"] is not None
+        (str(r[-1] if r[-1] is not None else "NULL"), _stats_from_row(r))
+        for r in conn.execute(q)
     ]
 
 
@@ -95,6 +288,8 @@ def _group_stats(
     group_col: str,
     where: str,
 ) -> List[Tuple[str, ScoreStats]]:
+    if _HAS_WINDOW:
+        return _sql_group_stats(conn, col, group_col, where)
     q = f"""
 SELECT {group_col} AS g, {col} AS v
 FROM news_articles na
@@ -102,10 +297,16 @@ JOIN legal_docs ld ON ld.id = na.legal_doc_id
 WHERE {where}
   AND {col} IS NOT NULL
 """
-    buckets: Dict[str, List[float]] = {}
-    for r in conn.execute(q):
-        g = str(r["g"] if r["g"] is not None else "NULL")
-        buckets.setdefault(g, []).append(float(r["v"]))
+    cur = _tuple_cursor(conn)
+    cur.execute(q)
+    buckets: Dict[str, array] = {}
+    while rows := cur.fetchmany():
+        for g, v in rows:
+            key = str(g if g is not None else "NULL")
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = array("d")
+            bucket.append(v)
     out = [(k, _stats(v)) for k, v in buckets.items()]
     out.sort(key=lambda x: x[1].count, reverse=True)
     return out
@@ -121,16 +322,23 @@ def main() -> None:
 
     conn = _connect(args.db)
     try:
+        na_cols = _table_columns(conn, "news_articles")
         final_col = _pick_score_column(
-            conn, ["final_score", "final_significance_score"]
+            na_cols, ["final_score", "final_significance_score"]
+        )
+        editorial_col = _pick_score_column(na_cols, ["score_editorial"])
+        cv_col = _pick_score_column(
+            na_cols, ["score_cv_relevance", "cv_relevance_score"]
+        )
+        impact_col = _pick_score_column(na_cols, ["score_impact", "impact_score"])
+        novelty_col = _pick_score_column(na_cols, ["score_novelty", "novelty_score"])
+        potential_col = _pick_score_column(
+            na_cols, ["score_potential", "potential_score"]
+        )
+        legacy_col = _pick_score_column(na_cols, ["score_legacy", "legacy_score"])
+        cred_col = _pick_score_column(
+            na_cols, ["score_credibility", "credibility_score"]
         )
-        editorial_col = _pick_score_column(conn, ["score_editorial"])
-        cv_col = _pick_score_column(conn, ["score_cv_relevance", "cv_relevance_score"])
-        impact_col = _pick_score_column(conn, ["score_impact", "impact_score"])
-        novelty_col = _pick_score_column(conn, ["score_novelty", "novelty_score"])
-        potential_col = _pick_score_column(conn, ["score_potential", "potential_score"])
-        legacy_col = _pick_score_column(conn, ["score_legacy", "legacy_score"])
-        cred_col = _pick_score_column(conn, ["score_credibility", "credibility_score"])
 
         where = "1=1"
         if args.scope == "judged":
@@ -153,40 +361,33 @@ def main() -> None:
 
         print(f"📌 Scope: {args.scope}  |  WHERE: {where}\n")
 
-        for label, col in cols:
-            if not col:
-                continue
-            vals = _fetch_vals(conn, col, where, ())
-            st = _stats(vals)
+        cols = [(label, col) for label, col in cols if col]
+        score_cols = [col for _, col in cols]
+        if not score_cols:
+            all_stats = []
+        elif _HAS_WINDOW:
+            all_stats = _sql_stats(conn, score_cols, where)
+        else:
+            all_stats = [_stats(v) for v in _fetch_columns(conn, score_cols, where)]
+
+        for (label, _), st in zip(cols, all_stats):
             print(f"📊 {label}")
             print(st)
             print()
 
-        if editorial_col:
-            print("📎 Por fonte (site_name) — score_editorial (top por volume)")
-            for g, st in _group_stats(conn, editorial_col, "ld.site_name", where):
-                print(f"{g} | {st}")
-            print()
-
-        if editorial_col:
-            print("📎 Por categoria_tematica — score_editorial (top por volume)")
-            gcol = (
-                "na.categoria_tematica"
-                if _col_exists(conn, "news_articles", "categoria_tematica")
-                else "NULL"
-            )
-            for g, st in _group_stats(conn, editorial_col, gcol, where):
-                print(f"{g} | {st}")
-            print()
+        cat_col = "na.categoria_tematica" if "categoria_tematica" in na_cols else "NULL"
+        judge_col = "na.judge_model_used" if "judge_model_used" in na_cols else "NULL"
+        groups = [
+            ("fonte (site_name)", "score_editorial", editorial_col, "ld.site_name"),
+            ("categoria_tematica", "score_editorial", editorial_col, cat_col),
+            ("modelo do juiz", "final_score", final_col, judge_col),
+        ]
 
-        if final_col:
-            print("📎 Por modelo do juiz — final_score (top por volume)")
-            mcol = (
-                "na.judge_model_used"
-                if _col_exists(conn, "news_articles", "judge_model_used")
-                else "NULL"
-            )
-            for g, st in _group_stats(conn, final_col, mcol, where):
+        for title, label, col, group_col in groups:
+            if not col:
+                continue
+            print(f"📎 Por {title} — {label} (top por volume)")
+            for g, st in _group_stats(conn, col, group_col, where):
                 print(f"{g} | {st}")
             print()
     finally:
@@ -17,23 +17,50 @@ class ScoreStats:
     max: float
 
 
-def _percentile(conn: sqlite3.Connection, column: str, p: float) -> float:
+_PERCENTILES = (0.5, 0.75, 0.90)
+
+
+def _percentiles(conn: sqlite3.Connection, column: str) -> tuple[float, ...]:
     row = conn.execute(
         f"""
-        SELECT {column}
-        FROM news_articles
-        WHERE review_status='SUCCESS'
-        ORDER BY {column}
-        LIMIT 1
-        OFFSET (
-          SELECT CAST(COUNT(*) * ? AS INT)
+        WITH s AS (
+          SELECT
+            {column} AS v,
+            ROW_NUMBER() OVER (ORDER BY {column}) - 1 AS r,
+            COUNT(*) OVER () AS n
           FROM news_articles
           WHERE review_status='SUCCESS'
         )
+        SELECT
+          MAX(CASE WHEN r = CAST(n * ? AS INT) THEN v END),
+          MAX(CASE WHEN r = CAST(n * ? AS INT) THEN v END),
+          MAX(CASE WHEN r = CAST(n * ? AS INT) THEN v END)
+        FROM s
         """,
-        (p,),
+        _PERCENTILES,
     ).fetchone()
-    return float(row[0]) if row else 0.0
+    return tuple(float(v) if v is not None else 0.0 for v in row)
+
+
+def _stats_from_base(
+    conn: sqlite3.Connection,
+    column: str,
+    cnt: object,
+    avg: object,
+    min_v: object,
+    max_v: object,
+) -> ScoreStats:
+    median, p75, p90 = _percentiles(conn, column)
+
+    return ScoreStats(
+        count=int(cnt or 0),
+        avg=round(float(avg or 0.0), 3),
+        median=round(median, 3),
+        p75=round(p75, 3),
+        p90=round(p90, 3),
+        min=round(float(min_v or 0.0), 3),
+        max=round(float(max_v or 0.0), 3),
+    )
 
 
 def compute_stats(conn: sqlite3.Connection, column: str) -> ScoreStats:
@@ -49,21 +76,38 @@ def compute_stats(conn: sqlite3.Connection, column: str) -> ScoreStats:
         """
     ).fetchone()
 
-    cnt = int(base[0] or 0)
-    avg = float(base[1] or 0.0)
-    min_v = float(base[2] or 0.0)
-    max_v = float(base[3] or 0.0)
+    return _stats_from_base(conn, column, base[0], base[1], base[2], base[3])
 
-    median = _percentile(conn, column, 0.5)
-    p75 = _percentile(conn, column, 0.75)
-    p90 = _percentile(conn, column, 0.90)
 
-    return ScoreStats(
-        count=cnt,
-        avg=round(avg, 3),
-        median=round(median, 3),
-        p75=round(p75, 3),
-        p90=round(p90, 3),
-        min=round(min_v, 3),
-        max=round(max_v, 3),
-    )
+def compute_stats_many(
+    conn: sqlite3.Connection, columns: List[str]
+) -> Dict[str, ScoreStats]:
+    """Calcula estatísticas de várias colunas com uma só agregação.
+
+    Args:
+        conn: Ligação SQLite.
+        columns: Colunas numéricas de news_articles.
+
+    Returns:
+        Estatísticas por coluna, na ordem recebida.
+    """
+    if not columns:
+        return {}
+    aggregates = ",\n          ".join(f"AVG({c}), MIN({c}), MAX({c})" for c in columns)
+    base = conn.execute(
+        f"""
+        SELECT
+          COUNT(*) AS cnt,
+          {aggregates}
+        FROM news_articles
+        WHERE review_status='SUCCESS'
+        """
+    ).fetchone()
+
+    out: Dict[str, ScoreStats] = {}
+    for i, column in enumerate(columns):
+        j = 1 + 3 * i
+        out[column] = _stats_from_base(
+            conn, column, base[0], base[j], base[j + 1], base[j + 2]
+        )
+    return out
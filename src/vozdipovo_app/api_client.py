@@ -2,22 +2,62 @@
 
 import random
 import time
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _build_session() -> requests.Session:
+    # Sem retries no adapter: post_with_retry já faz o backoff
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+_SESSION = _build_session()
+
+
+@lru_cache(maxsize=8)
+def _backoff_schedule(max_retries: int) -> Tuple[float, ...]:
+    # 2, 4, 8, 16, 32, 60, 60, ...
+    return tuple(min(2.0 * 2**i, 60.0) for i in range(max_retries))
+
+
 def parse_api_error(resp: requests.Response) -> str:
+    # Descodifica direto: resp.text pode correr deteção de charset no corpo todo
     try:
-        return resp.text
+        return resp.content.decode(resp.encoding or "utf-8", errors="replace")
+    except LookupError:
+        return resp.content.decode("utf-8", errors="replace")
     except Exception:
         return f"status={resp.status_code}"
 
 
+class _ApiErrorMessage:
+    """Mensagem de erro que só lê o corpo da resposta quando é formatada."""
+
+    __slots__ = ("_resp",)
+
+    def __init__(self, resp: requests.Response) -> None:
+        self._resp = resp
+
+    def __str__(self) -> str:
+        return f"API error {self._resp.status_code}: {parse_api_error(self._resp)}"
+
+
 def post_with_retry(
     url: str, headers: Dict[str, str], payload: Dict[str, Any], max_retries: int = 5
 ) -> requests.Response:
@@ -25,14 +65,19 @@ def post_with_retry(
     Faz um POST para uma API com uma estratégia de exponential backoff.
     Robusto para falhas de rede (DNS, Timeout, Connection Refused).
     """
-    backoff_delay = 2.0
+    schedule = _backoff_schedule(max_retries)
+    if orjson is not None:
+        body_kwargs: Dict[str, Any] = {
+            "data": orjson.dumps(payload),
+            "headers": {**headers, "Content-Type": "application/json"},
+        }
+    else:
+        body_kwargs = {"json": payload, "headers": headers}
 
     for attempt in range(max_retries):
         try:
             # Timeout: (connect=10s, read=60s) - Importante para conexões lentas
-            response = requests.post(
-                url, headers=headers, json=payload, timeout=(10, 60)
-            )
+            response = _SESSION.post(url, timeout=(10, 60), **body_kwargs)
 
             # Erros de servidor (5xx) ou Rate Limit (429) -> Retry
             if 500 <= response.status_code < 600 or response.status_code == 429:
@@ -57,14 +102,12 @@ def post_with_retry(
                 logger.error("❌ Todas as tentativas de chamada à API falharam.")
                 raise e
 
-            sleep_time = backoff_delay + random.uniform(0, 1)
+            sleep_time = schedule[attempt] + random.random()
             logger.info(
                 f"⏳ A aguardar {sleep_time:.2f}s antes da próxima tentativa..."
             )
             time.sleep(sleep_time)
 
-            backoff_delay = min(backoff_delay * 2, 60)
-
     raise RuntimeError("Loop de retry terminou sem resultado.")
 
 
@@ -93,8 +136,8 @@ def call_publicai(api_key: str, model: str, prompt: str, **kwargs) -> Dict[str,
     resp = post_with_retry(url, headers, payload)
 
     if resp.status_code >= 400:
-        raise requests.exceptions.HTTPError(
-            f"API error {resp.status_code}: {parse_api_error(resp)}", response=resp
-        )
+        raise requests.exceptions.HTTPError(_ApiErrorMessage(resp), response=resp)
 
+    if orjson is not None:
+        return orjson.loads(resp.content)
     return resp.json()
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from pydantic import ValidationError
 
@@ -34,15 +37,19 @@ class RevisionResult:
     error: Optional[str]
 
 
-def _build_rotator(models: Sequence[str], timeout_seconds: float) -> LLMRotator:
-    """Constrói um rotator para revisão.
+@lru_cache(maxsize=8)
+def _groq_client(api_key: Optional[str], timeout_seconds: float) -> GroqClient:
+    """Constrói o cliente Groq, partilhado entre artigos.
+
+    A GROQ_API_KEY do ambiente entra na chave da cache para que uma chave
+    nova crie outro cliente.
 
     Args:
-        models: Lista de modelos.
+        api_key: Valor atual de GROQ_API_KEY no ambiente.
         timeout_seconds: Timeout do provider.
 
     Returns:
-        Instância de LLMRotator.
+        Instância de GroqClient.
 
     Raises:
         ValidationError: Quando GROQ_API_KEY não está disponível.
@@ -50,12 +57,35 @@ def _build_rotator(models: Sequence[str], timeout_seconds: float) -> LLMRotator:
     cfg = GroqConfig.from_env().model_copy(
         update={"timeout_seconds": int(timeout_seconds)}
     )
-    client = GroqClient(cfg)
-    specs = [ModelSpec(provider=LLMProvider.GROQ, model=m) for m in models]
+    return GroqClient(cfg)
+
+
+@lru_cache(maxsize=8)
+def _model_specs(models: Tuple[str, ...]) -> Tuple[ModelSpec, ...]:
+    return tuple(ModelSpec(provider=LLMProvider.GROQ, model=m) for m in models)
+
+
+def _build_rotator(models: Tuple[str, ...], timeout_seconds: float) -> LLMRotator:
+    """Constrói um rotator novo para revisão.
+
+    O cliente e os specs são reutilizados, mas os cooldowns e modelos
+    desativados ficam limitados a um artigo.
+
+    Args:
+        models: Lista de modelos.
+        timeout_seconds: Timeout do provider.
+
+    Returns:
+        Instância de LLMRotator.
+
+    Raises:
+        ValidationError: Quando GROQ_API_KEY não está disponível.
+    """
+    client = _groq_client(os.environ.get("GROQ_API_KEY"), float(timeout_seconds))
     return LLMRotator(
         groq=client,
         openrouter=None,
-        models=specs,
+        models=list(_model_specs(models)),
     )
 
 
@@ -86,7 +116,9 @@ def revise_article(
         )
 
     try:
-        rotator = _build_rotator(models=models, timeout_seconds=timeout_seconds)
+        rotator = _build_rotator(
+            models=tuple(models), timeout_seconds=float(timeout_seconds)
+        )
     except ValidationError as e:
         return RevisionResult(
             ok=False,
@@ -145,6 +177,38 @@ def revise_article(
         )
 
 
+def revise_articles(
+    texts: Sequence[str],
+    models: Sequence[str],
+    timeout_seconds: float = 60.0,
+    temperature: float = 0.2,
+    max_workers: int = 4,
+) -> List[RevisionResult]:
+    """Revê vários artigos em paralelo, partilhando o cliente e a sessão HTTP.
+
+    Args:
+        texts: Textos dos artigos.
+        models: Lista de modelos.
+        timeout_seconds: Timeout do provider.
+        temperature: Temperatura.
+        max_workers: Número máximo de revisões em curso.
+
+    Returns:
+        List[RevisionResult]: Resultados pela mesma ordem de texts.
+    """
+    if not texts:
+        return []
+    revise = partial(
+        revise_article,
+        models=tuple(models),
+        timeout_seconds=timeout_seconds,
+        temperature=temperature,
+    )
+    workers = max(1, min(int(max_workers), len(texts)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(revise, texts))
+
+
 if __name__ == "__main__":
     demo = revise_article(
         text="Texto de teste para revisão.",
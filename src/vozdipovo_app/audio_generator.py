@@ -2,23 +2,29 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import re
 import shutil
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import edge_tts
-import nest_asyncio
-from pydub import AudioSegment
 
+from vozdipovo_app.database import sha256_text
 from vozdipovo_app.utils.logger import get_logger
 
 logger = get_logger(__name__)
-nest_asyncio.apply()
 
-AudioSegment.converter = shutil.which("ffmpeg") or "/usr/bin/ffmpeg"
-AudioSegment.ffprobe = shutil.which("ffprobe") or "/usr/bin/ffprobe"
+
+@lru_cache(maxsize=1)
+def _ensure_pydub() -> None:
+    from pydub import AudioSegment
+
+    AudioSegment.converter = shutil.which("ffmpeg") or "/usr/bin/ffmpeg"
+    AudioSegment.ffprobe = shutil.which("ffprobe") or "/usr/bin/ffprobe"
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,91 +34,219 @@ class AudioConfig:
     voice: str = "pt-PT-RaquelNeural"
 
 
+_CACHE_SUBDIR = ".tts_cache"
+
+
+_UNIDADES_MOEDA = (
+    (1_000_000_000, "bilião de", "biliões de"),
+    (1_000_000, "milhão de", "milhões de"),
+    (1_000, "mil", "mil"),
+)
+
+
 def _formatar_moeda_para_leitura(match: re.Match[str]) -> str:
     numero_str = match.group(1).replace(".", "").replace(",", "")
     try:
         numero = int(numero_str)
-        if numero >= 1_000_000_000:
-            valor = numero / 1_000_000_000
-            unidade = "biliões de" if valor > 1 else "bilião de"
-            valor_str = f"{valor:.3f}".rstrip("0").rstrip(".")
-            return f"{valor_str} {unidade} escudos"
-        if numero >= 1_000_000:
-            valor = numero / 1_000_000
-            unidade = "milhões de" if valor > 1 else "milhão de"
-            valor_str = f"{valor:.3f}".rstrip("0").rstrip(".")
-            return f"{valor_str} {unidade} escudos"
-        if numero >= 1_000:
-            valor = numero / 1_000
-            valor_str = f"{valor:.3f}".rstrip("0").rstrip(".")
-            return f"{valor_str} mil escudos"
-        return f"{numero_str} escudos"
     except (ValueError, TypeError):
         return match.group(0)
+    for limite, singular, plural in _UNIDADES_MOEDA:
+        if numero >= limite:
+            valor = numero / limite
+            valor_str = f"{valor:.3f}".rstrip("0").rstrip(".")
+            return f"{valor_str} {plural if valor > 1 else singular} escudos"
+    return f"{numero_str} escudos"
+
+
+_RE_MOEDA = re.compile(r"([\d\.,\s]+)\$(\d{2})")
+_MARKUP_TRANS = str.maketrans("", "", "*#_")
+_RE_WS = re.compile(r"\s+")
+
+_SUBS = {
+    "n.º": "número",
+    "art.º": "artigo",
+    "p. ex.": "por exemplo",
+    "S.A.": "S A",
+    "Lda.": "Limitada",
+    "Dr.": "Doutor",
+    "Dra.": "Doutora",
+    "Eng.": "Engenheiro",
+}
+
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """Constrói uma alternância fatorizada por prefixos (trie) que casa o mais longo.
+
+    Args:
+        words: Literais a reconhecer.
+
+    Returns:
+        str: Padrão regex equivalente a uma alternância ordenada por comprimento.
+    """
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+_SUBS_RE = re.compile(_trie_pattern(list(_SUBS)))
+
+
+def _expandir_abreviatura(match: re.Match[str]) -> str:
+    return _SUBS[match.group(0)]
 
 
 def _limpar_texto_para_tts(texto: str) -> str:
     if not texto:
         return ""
 
-    texto_limpo = re.sub(r"([\d\.,\s]+)\$(\d{2})", _formatar_moeda_para_leitura, texto)
-    substituicoes = {
-        "n.º": "número",
-        "art.º": "artigo",
-        "p. ex.": "por exemplo",
-        "S.A.": "S A",
-        "Lda.": "Limitada",
-        "Dr.": "Doutor",
-        "Dra.": "Doutora",
-        "Eng.": "Engenheiro",
-    }
-    for abrev, expansao in substituicoes.items():
-        texto_limpo = texto_limpo.replace(abrev, expansao)
+    texto_limpo = texto
+    if "$" in texto_limpo:
+        texto_limpo = _RE_MOEDA.sub(_formatar_moeda_para_leitura, texto_limpo)
+    texto_limpo = _SUBS_RE.sub(_expandir_abreviatura, texto_limpo)
 
     texto_limpo = texto_limpo.replace("\n", " . ")
-    texto_limpo = re.sub(r"[\*#_]", "", texto_limpo)
-    texto_limpo = re.sub(r"\s+", " ", texto_limpo).strip()
+    texto_limpo = texto_limpo.translate(_MARKUP_TRANS)
+    texto_limpo = _RE_WS.sub(" ", texto_limpo).strip()
     return texto_limpo
 
 
 async def _gerar_audio_edge(texto: str, ficheiro_saida: str, voice: str) -> bool:
     try:
         communicate = edge_tts.Communicate(texto, voice)
-        await communicate.save(ficheiro_saida)
+        with open(ficheiro_saida, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
         return True
     except Exception as e:
         logger.error(f"Erro interno EdgeTTS: {e}")
         return False
 
 
-def gerar_audio_para_artigo(
+def _link_or_copy(src: Path, dst: Path) -> None:
+    # Hard link partilha o mp3 entre o output e a cache sem duplicar em disco
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+async def _gerar_audio_async(
     texto_do_artigo: str,
     diretorio_output: str,
     nome_ficheiro: str,
-    cfg: Optional[AudioConfig] = None,
+    voice: str,
+    sem: asyncio.Semaphore,
 ) -> Optional[str]:
     texto_limpo = _limpar_texto_para_tts(texto_do_artigo)
     if not texto_limpo:
         logger.warning("Texto para geração de áudio está vazio após limpeza.")
         return None
 
-    audio_cfg = cfg or AudioConfig()
-
     try:
         output_path = Path(diretorio_output)
         output_path.mkdir(parents=True, exist_ok=True)
         caminho_final = output_path / f"{nome_ficheiro}.mp3"
 
-        ok = asyncio.run(
-            _gerar_audio_edge(texto_limpo, str(caminho_final), audio_cfg.voice)
-        )
+        cache_dir = output_path / _CACHE_SUBDIR
+        chave = sha256_text(voice + "\n" + texto_limpo)[:16]
+        cached = cache_dir / f"{chave}.mp3"
+        if cached.is_file() and cached.stat().st_size > 0:
+            _link_or_copy(cached, caminho_final)
+            return str(caminho_final)
+
+        # Pode ser um hard link para a cache, escrever por cima estragava-a
+        caminho_final.unlink(missing_ok=True)
+        async with sem:
+            ok = await _gerar_audio_edge(texto_limpo, str(caminho_final), voice)
         if not ok:
             return None
 
         if caminho_final.exists() and caminho_final.stat().st_size > 0:
+            cache_dir.mkdir(exist_ok=True)
+            _link_or_copy(caminho_final, cached)
             return str(caminho_final)
         logger.error("Ficheiro de áudio não foi criado corretamente.")
         return None
     except Exception as e:
         logger.error(f"Erro fatal ao gerar áudio para '{nome_ficheiro}': {e}")
         return None
+
+
+async def gerar_audio_para_artigos_batch(
+    items: Sequence[Tuple[str, str, str]],
+    cfg: Optional[AudioConfig] = None,
+    max_concorrencia: int = 8,
+) -> List[Optional[str]]:
+    """Generate audio for several articles concurrently.
+
+    Args:
+        items: Tuples of (texto_do_artigo, diretorio_output, nome_ficheiro).
+        cfg: Audio configuration.
+        max_concorrencia: Maximum simultaneous EdgeTTS requests.
+
+    Returns:
+        List[Optional[str]]: Audio file path per item, or None on failure.
+    """
+    _ensure_pydub()
+    audio_cfg = cfg or AudioConfig()
+    sem = asyncio.Semaphore(max(1, int(max_concorrencia)))
+    return list(
+        await asyncio.gather(
+            *(
+                _gerar_audio_async(texto, diretorio, nome, audio_cfg.voice, sem)
+                for texto, diretorio, nome in items
+            )
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _audio_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="tts-loop", daemon=True).start()
+    return loop
+
+
+def gerar_audio_para_artigos(
+    items: Sequence[Tuple[str, str, str]],
+    cfg: Optional[AudioConfig] = None,
+    max_concorrencia: int = 8,
+) -> List[Optional[str]]:
+    """Synchronous entrypoint for gerar_audio_para_artigos_batch.
+
+    Args:
+        items: Tuples of (texto_do_artigo, diretorio_output, nome_ficheiro).
+        cfg: Audio configuration.
+        max_concorrencia: Maximum simultaneous EdgeTTS requests.
+
+    Returns:
+        List[Optional[str]]: Audio file path per item, or None on failure.
+    """
+    coro = gerar_audio_para_artigos_batch(items, cfg, max_concorrencia)
+    return asyncio.run_coroutine_threadsafe(coro, _audio_loop()).result()
+
+
+def gerar_audio_para_artigo(
+    texto_do_artigo: str,
+    diretorio_output: str,
+    nome_ficheiro: str,
+    cfg: Optional[AudioConfig] = None,
+) -> Optional[str]:
+    (fp,) = gerar_audio_para_artigos(
+        [(texto_do_artigo, diretorio_output, nome_ficheiro)], cfg
+    )
+    return fp
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Iterable, Set
 
 DEFAULT_CATEGORY_ALIASES: Dict[str, str] = {
@@ -34,6 +35,20 @@ DEFAULT_CATEGORY_ALIASES: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=4096)
+def fold_category(s: str) -> str:
+    """Fold a category name for matching: no accents, casefolded, single spaces."""
+    raw = (s or "").strip()
+    if not raw:
+        return ""
+    if raw.isascii():
+        return " ".join(raw.split()).casefold()
+    norm = unicodedata.normalize("NFKD", raw)
+    norm = "".join(ch for ch in norm if not unicodedata.combining(ch))
+    norm = " ".join(norm.split()).casefold()
+    return norm
+
+
 @dataclass(frozen=True, slots=True)
 class CategoryNormalizer:
     """Normalize and canonicalize category names produced by models."""
@@ -41,16 +56,13 @@ class CategoryNormalizer:
     allowed_categories: Set[str]
     aliases: Dict[str, str]
     fallback: str = "Geral"
+    _folded_index: Dict[str, str] = field(init=False, repr=False, compare=False)
 
-    @staticmethod
-    def _fold(s: str) -> str:
-        raw = (s or "").strip()
-        if not raw:
-            return ""
-        norm = unicodedata.normalize("NFKD", raw)
-        norm = "".join(ch for ch in norm if not unicodedata.combining(ch))
-        norm = " ".join(norm.split()).casefold()
-        return norm
+    def __post_init__(self) -> None:
+        index: Dict[str, str] = {}
+        for cat in self.allowed_categories:
+            index.setdefault(fold_category(cat), cat)
+        object.__setattr__(self, "_folded_index", index)
 
     def canonical(self, name: str) -> str:
         """Return canonical category name or fallback.
@@ -61,7 +73,7 @@ class CategoryNormalizer:
         Returns:
             str: Canonical category.
         """
-        folded = self._fold(name)
+        folded = fold_category(name)
         if not folded:
             return self.fallback
 
@@ -69,11 +81,7 @@ class CategoryNormalizer:
         if alias and alias in self.allowed_categories:
             return alias
 
-        for cat in self.allowed_categories:
-            if self._fold(cat) == folded:
-                return cat
-
-        return self.fallback
+        return self._folded_index.get(folded, self.fallback)
 
 
 def build_normalizer(allowed_categories: Iterable[str]) -> CategoryNormalizer:
@@ -89,5 +97,5 @@ def build_normalizer(allowed_categories: Iterable[str]) -> CategoryNormalizer:
     if "Geral" not in allowed:
         allowed.add("Geral")
     return CategoryNormalizer(
-        allowed_categories=allowed, aliases=dict(DEFAULT_CATEGORY_ALIASES)
+        allowed_categories=allowed, aliases=DEFAULT_CATEGORY_ALIASES
     )
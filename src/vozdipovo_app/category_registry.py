@@ -1,11 +1,11 @@
 #!filepath: src/vozdipovo_app/category_registry.py
 from __future__ import annotations
 
-import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Dict, List
 
+from vozdipovo_app.category_map import DEFAULT_CATEGORY_ALIASES, fold_category
 from vozdipovo_app.editorial.config import get_editorial_config
 
 
@@ -22,16 +22,13 @@ class CategoryRegistry:
     category_ids: Dict[str, int]
     allowed_editorial_categories: List[str]
     aliases: Dict[str, str]
+    _folded_index: Dict[str, str] = field(init=False, repr=False, compare=False)
 
-    @staticmethod
-    def _fold(s: str) -> str:
-        t = (s or "").strip()
-        if not t:
-            return ""
-        t = unicodedata.normalize("NFKD", t)
-        t = "".join(ch for ch in t if not unicodedata.combining(ch))
-        t = " ".join(t.split()).casefold()
-        return t
+    def __post_init__(self) -> None:
+        index: Dict[str, str] = {}
+        for k in self.category_ids:
+            index.setdefault(fold_category(k), k)
+        object.__setattr__(self, "_folded_index", index)
 
     def canonical(self, name: str) -> str:
         """Return canonical category name.
@@ -42,15 +39,13 @@ class CategoryRegistry:
         Returns:
             str: Canonical category name, defaults to Geral.
         """
-        folded = self._fold(name)
+        folded = fold_category(name)
         if not folded:
             return "Geral"
-        if folded in self.aliases:
-            return self.aliases[folded]
-        for k in self.category_ids.keys():
-            if self._fold(k) == folded:
-                return k
-        return "Geral"
+        alias = self.aliases.get(folded)
+        if alias is not None:
+            return alias
+        return self._folded_index.get(folded, "Geral")
 
     def id_for(self, name: str) -> int:
         """Return WordPress category id for a category name.
@@ -87,38 +82,10 @@ def get_category_registry() -> CategoryRegistry:
     cfg = get_editorial_config()
     wp = cfg.wordpress
 
-    aliases = {
-        "economia": "Economia",
-        "negocios": "Economia",
-        "economia e negocios": "Economia",
-        "economia/negocios": "Economia",
-        "ciencia": "Ciência",
-        "desporto": "Desporto",
-        "desporte": "Desporto",
-        "politica": "Política",
-        "saude": "Saúde",
-        "sociedade": "Sociedade",
-        "tecnologia": "Tecnologia",
-        "internacional": "Internacional",
-        "cultura": "Cultura",
-        "lifestyle": "Lifestyle",
-        "estilo de vida": "Lifestyle",
-        "casos do dia": "Casos do Dia",
-        "outras": "Outras",
-        "geral": "Geral",
-        "sem categoria": "Geral",
-        "desconhecido": "Geral",
-        "indefinido": "Geral",
-        "breaking": "Breaking News",
-        "breaking news": "Breaking News",
-        "featured": "Featured Stories",
-        "featured stories": "Featured Stories",
-    }
-
     return CategoryRegistry(
         category_ids=dict(wp.category_ids),
         allowed_editorial_categories=list(wp.allowed_editorial_categories),
-        aliases=aliases,
+        aliases=DEFAULT_CATEGORY_ALIASES,
     )
 
 
@@ -1,7 +1,11 @@
 #!filepath: src/vozdipovo_app/category_rules.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+_SEED_BY_SITE = {"bo_cv": "Legislação", "governo_cv": "Política"}
+_FIXED_BY_SITE = {"bo_cv": "Legislação"}
+_FALLBACK_BY_SITE = {"governo_cv": "Política"}
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,6 +19,10 @@ class CategoryContext:
 
     site_name: str
     act_type: str = ""
+    site_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "site_key", (self.site_name or "").strip().casefold())
 
 
 def resolve_seed_category(ctx: CategoryContext, *, default: str = "Geral") -> str:
@@ -29,15 +37,7 @@ def resolve_seed_category(ctx: CategoryContext, *, default: str = "Geral") -> st
     Returns:
         str: Category name.
     """
-    site = (ctx.site_name or "").strip().casefold()
-
-    if site == "bo_cv":
-        return "Legislação"
-
-    if site == "governo_cv":
-        return "Política"
-
-    return default
+    return _SEED_BY_SITE.get(ctx.site_key, default)
 
 
 def resolve_categoria_tematica(
@@ -63,15 +63,12 @@ def resolve_categoria_tematica(
     Returns:
         str: Final category name.
     """
-    site = (ctx.site_name or "").strip().casefold()
-
-    m = (model_category or "").strip()
-    d = (draft_category or "").strip()
-
-    if site == "bo_cv":
-        return "Legislação"
-
-    if site == "governo_cv":
-        return m or d or "Política"
-
-    return m or d or fallback
+    fixed = _FIXED_BY_SITE.get(ctx.site_key)
+    if fixed:
+        return fixed
+
+    return (
+        (model_category or "").strip()
+        or (draft_category or "").strip()
+        or _FALLBACK_BY_SITE.get(ctx.site_key, fallback)
+    )
@@ -7,6 +7,11 @@ import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from vozdipovo_app.editorial.config import (
     EditorialConfigError,
     load_editorial_config_from_path,
@@ -54,6 +59,14 @@ def _dump(path: Path) -> int:
         return 2
 
     payload: dict[str, Any] = cfg.dict(by_alias=True)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        buffer.write(orjson.dumps(payload, option=opts))
+        buffer.flush()
+        return 0
+
     sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2))
     sys.stdout.write("\n")
     return 0
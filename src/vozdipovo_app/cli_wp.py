@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
+import threading
 import time
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Union
 
 import typer
 
 from .config import load_app_config
-from .wordpress.client import WPClient, WPConfig
+from .wordpress.client import WordPressClient, WPConfig
 from .wordpress.publisher import upsert_post
 
 app = typer.Typer(help="CLI WordPress para publicar notícias.")
 
+_PUBLISH_WORKERS = 4
 
-def _client_from_cfg(cfg) -> WPClient:
+
+def _client_from_cfg(cfg) -> WordPressClient:
+    pool_maxsize = int(cfg["wordpress"].get("pool_maxsize", 10))
     wpcfg = WPConfig(
         base_url=cfg["wordpress"]["base_url"],
         username=cfg["wordpress"]["username"],
@@ -23,8 +29,122 @@ def _client_from_cfg(cfg) -> WPClient:
         default_status=cfg["wordpress"].get("default_status", "publish"),
         timeout=int(cfg["wordpress"].get("timeout", 30)),
         rate_sleep=float(cfg["wordpress"].get("rate_sleep", 1.0)),
+        pool_maxsize=max(_PUBLISH_WORKERS, pool_maxsize),
     )
-    return WPClient(wpcfg)
+    return WordPressClient(wpcfg)
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    return conn
+
+
+class _RateLimiter:
+    """Garante um intervalo mínimo entre arranques de pedidos, entre threads."""
+
+    def __init__(self, interval: float):
+        self._interval = max(0.0, float(interval))
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _keywords(row: sqlite3.Row) -> Union[str, List[str]]:
+    raw = str(row["keywords_json"] or "").strip()
+    if raw:
+        try:
+            parsed = json.loads(raw)
+            if isinstance(parsed, list):
+                return [str(x) for x in parsed]
+        except Exception:
+            pass
+    return str(row["keywords"] or "")
+
+
+def _publish_doc(
+    conn: sqlite3.Connection, client: WordPressClient, doc_id: int, status: str
+) -> Dict[str, Any]:
+    """Publica o artigo de um legal_doc_id e regista o resultado em news_articles."""
+    conn.row_factory = sqlite3.Row
+    row = conn.execute(
+        """
+        SELECT id, titulo, corpo_md, keywords, keywords_json,
+               categoria_tematica, subcategoria, wp_post_id
+        FROM news_articles
+        WHERE legal_doc_id = ?
+        """,
+        (int(doc_id),),
+    ).fetchone()
+    if row is None:
+        raise LookupError(f"Sem artigo para legal_doc_id={doc_id}")
+
+    categoria = str(row["categoria_tematica"] or "Geral").strip() or "Geral"
+    wp_post_id = int(row["wp_post_id"] or 0)
+    try:
+        post_id, link = upsert_post(
+            title=str(row["titulo"] or "").strip(),
+            content_md=str(row["corpo_md"] or "").strip(),
+            keywords=_keywords(row),
+            categoria_tematica=categoria,
+            subcategoria=str(row["subcategoria"] or "").strip(),
+            existing_post_id=wp_post_id if wp_post_id > 0 else None,
+            default_status=status,
+            client=client,
+        )
+    except Exception as e:
+        with conn:
+            conn.execute(
+                """
+                UPDATE news_articles
+                SET publishing_status='FAILED', wp_error=?, updated_at=datetime('now')
+                WHERE id=?
+                """,
+                (str(e)[:900], int(row["id"])),
+            )
+        raise
+
+    with conn:
+        conn.execute(
+            """
+            UPDATE news_articles
+            SET publishing_status='SUCCESS',
+                published_at=datetime('now'),
+                wp_post_id=?,
+                wp_url=?,
+                wp_error=NULL,
+                updated_at=datetime('now')
+            WHERE id=?
+            """,
+            (int(post_id), str(link or "")[:800], int(row["id"])),
+        )
+    return {"id": post_id, "status": status, "link": link}
+
+
+def _publish_one(
+    db_path: str,
+    client: WordPressClient,
+    doc_id: int,
+    status: str,
+    limiter: _RateLimiter,
+) -> Dict[str, Any]:
+    limiter.wait()
+    conn = _connect(db_path)
+    try:
+        return _publish_doc(conn, client, doc_id, status)
+    finally:
+        conn.close()
 
 
 # --- FUNÇÃO "OPERÁRIA" COM A LÓGICA PURA ---
@@ -39,8 +159,12 @@ def _do_bulk_publish(
     """
     cfg = load_app_config()
     client = _client_from_cfg(cfg)
-    conn = sqlite3.connect(cfg["paths"]["db"])
+    db_path = cfg["paths"]["db"]
+    conn = _connect(db_path)
+    limiter = _RateLimiter(sleep_sec)
+    pool = ThreadPoolExecutor(max_workers=_PUBLISH_WORKERS)
     page = 0
+    last_id = 0
 
     try:
         while True:
@@ -49,12 +173,13 @@ def _do_bulk_publish(
                 """
               SELECT legal_doc_id
               FROM news_articles
-              WHERE (review_status = 'SUCCESS' OR review_status IS NULL)
+              WHERE legal_doc_id > ?
+                AND (review_status = 'SUCCESS' OR review_status IS NULL)
                 AND (publishing_status = 'PENDING' OR publishing_status IS NULL)
               ORDER BY legal_doc_id ASC
-              LIMIT ? OFFSET ?
+              LIMIT ?
             """,
-                (page_size, page * page_size),
+                (last_id, page_size),
             ).fetchall()
 
             if not rows:
@@ -62,22 +187,30 @@ def _do_bulk_publish(
                 break
 
             ids = [int(r[0]) for r in rows]
+            last_id = ids[-1]
             print(f"Página {page + 1}: {ids}")
-            for doc_id in ids:
+            futures = {
+                pool.submit(
+                    _publish_one, db_path, client, doc_id, status, limiter
+                ): doc_id
+                for doc_id in ids
+            }
+            for fut in as_completed(futures):
+                doc_id = futures[fut]
                 try:
-                    data = upsert_post(conn, client, doc_id, status=status)
+                    data = fut.result()
                     print(
                         f"  [ok] {doc_id} -> post {data.get('id')} ({data.get('status')})"
                     )
                 except Exception as e:
                     print(f"  [erro] {doc_id}: {e}")
-                time.sleep(sleep_sec)
 
             page += 1
             if max_pages != 0 and page >= max_pages:
                 print("A parar por max_pages.")
                 break
     finally:
+        pool.shutdown(wait=True)
         conn.close()
 
 
@@ -91,9 +224,9 @@ def wp_publish(
 ):
     cfg = load_app_config()
     client = _client_from_cfg(cfg)
-    conn = sqlite3.connect(cfg["paths"]["db"])
+    conn = _connect(cfg["paths"]["db"])
     try:
-        data = upsert_post(conn, client, doc_id, status=status)
+        data = _publish_doc(conn, client, doc_id, status)
         typer.echo(
             f"[ok] legal_doc_id={doc_id} -> post_id={data.get('id')} ({data.get('status')}) url={data.get('link')}"
         )
@@ -1,6 +1,7 @@
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 SCHEMA = """CREATE TABLE IF NOT EXISTS processed_texts (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -25,11 +26,25 @@ SCHEMA = """CREATE TABLE IF NOT EXISTS processed_texts (
 CREATE UNIQUE INDEX IF NOT EXISTS ux_processed_filehash ON processed_texts(file_hash);
 """
 
+@contextmanager
+def batch(conn) -> Iterator[sqlite3.Connection]:
+    """Agrupa várias escritas numa única transação, com um só commit no fim."""
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
 def ensure_db(db_path: str):
     p = Path(db_path)
     p.parent.mkdir(parents=True, exist_ok=True)  # <— cria diretório
     conn = sqlite3.connect(str(p))               # <— usa str(p)
     conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA mmap_size=268435456;")
     conn.executescript(SCHEMA)
     return conn
 
@@ -58,3 +73,29 @@ def update_row_response(conn, row_id: int, response_text: Optional[str], status:
     sql = f"UPDATE processed_texts SET {', '.join(fields)} WHERE id = ?"
     conn.execute(sql, vals)
     conn.commit()
+
+_UPDATE_RESPONSE_SQL = "UPDATE processed_texts SET response_text = ?, status = ?, error = ? WHERE id = ?"
+_UPDATE_RESPONSE_USAGE_SQL = (
+    "UPDATE processed_texts SET response_text = ?, status = ?, error = ?, "
+    "usage_prompt_tokens = ?, usage_completion_tokens = ?, usage_total_tokens = ? WHERE id = ?"
+)
+
+def update_rows_response(conn, updates: Iterable[Tuple[int, Optional[str], str, Optional[dict], Optional[str]]]) -> int:
+    """Aplica vários update_row_response numa só transação.
+
+    Cada item é (row_id, response_text, status, usage, error), com a mesma
+    semântica de update_row_response.
+    """
+    n = 0
+    with batch(conn):
+        for row_id, response_text, status, usage, error in updates:
+            if usage:
+                conn.execute(
+                    _UPDATE_RESPONSE_USAGE_SQL,
+                    (response_text, status, error, usage.get("prompt_tokens"),
+                     usage.get("completion_tokens"), usage.get("total_tokens"), row_id),
+                )
+            else:
+                conn.execute(_UPDATE_RESPONSE_SQL, (response_text, status, error, row_id))
+            n += 1
+    return n
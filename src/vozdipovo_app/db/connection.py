@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
 
+from vozdipovo_app.db.sqlite_conn import apply_pragmas
+
 
 @dataclass(frozen=True, slots=True)
 class DbConfig:
@@ -44,8 +46,7 @@ class Db:
         self._cfg.path.parent.mkdir(parents=True, exist_ok=True)
         conn = sqlite3.connect(str(self._cfg.path), timeout=self._cfg.timeout_seconds)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA busy_timeout = ?;", (self._cfg.timeout_seconds * 1000,))
+        apply_pragmas(conn, busy_timeout_ms=self._cfg.timeout_seconds * 1000)
         return conn
 
     def __enter__(self) -> sqlite3.Connection:
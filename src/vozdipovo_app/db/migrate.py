@@ -5,12 +5,16 @@ import os
 import sqlite3
 
 from vozdipovo_app.db.schema import SCHEMA
+from vozdipovo_app.db.sqlite_conn import apply_pragmas
+
+# executescript faz COMMIT antes de correr, por isso a transação vai no script
+_SCHEMA_SCRIPT = f"BEGIN IMMEDIATE;\n{SCHEMA}\nCOMMIT;"
 
 
 def connect(db_path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
+    apply_pragmas(conn)
     return conn
 
 
@@ -19,16 +23,19 @@ def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
     return {r["name"] for r in rows}
 
 
-def _add_column_if_missing(conn: sqlite3.Connection, table: str, col_def: str) -> bool:
+def _add_column_if_missing(
+    conn: sqlite3.Connection, table: str, col_def: str, existing_cols: set[str]
+) -> bool:
     col_name = col_def.strip().split()[0]
-    if col_name in _columns(conn, table):
+    if col_name in existing_cols:
         return False
     conn.execute(f"ALTER TABLE {table} ADD COLUMN {col_def};")
+    existing_cols.add(col_name)
     return True
 
 
 def _ensure_tables(conn: sqlite3.Connection) -> None:
-    conn.executescript(SCHEMA)
+    conn.executescript(_SCHEMA_SCRIPT)
 
 
 def _ensure_unique_indexes(conn: sqlite3.Connection) -> bool:
@@ -51,6 +58,7 @@ def _apply_migrations(conn: sqlite3.Connection) -> list[str]:
     }
 
     if "legal_docs" in tables:
+        cols_legal = _columns(conn, "legal_docs")
         for col_def in (
             "url_hash TEXT",
             "pub_date TEXT",
@@ -61,12 +69,13 @@ def _apply_migrations(conn: sqlite3.Connection) -> list[str]:
             "raw_payload_json TEXT",
             "fetched_at TEXT",
         ):
-            if _add_column_if_missing(conn, "legal_docs", col_def):
+            if _add_column_if_missing(conn, "legal_docs", col_def, cols_legal):
                 applied.append(f"add_column=legal_docs.{col_def.split()[0]}")
 
     if "news_articles" in tables:
+        cols_news = _columns(conn, "news_articles")
         for col_def in ("decision TEXT",):
-            if _add_column_if_missing(conn, "news_articles", col_def):
+            if _add_column_if_missing(conn, "news_articles", col_def, cols_news):
                 applied.append(f"add_column=news_articles.{col_def.split()[0]}")
 
         _ensure_unique_indexes(conn)
@@ -85,11 +94,12 @@ def ensure_schema(db_path: str) -> sqlite3.Connection:
 
 
 def recreate_schema(db_path: str) -> sqlite3.Connection:
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Em WAL, um processo que caiu pode deixar -wal e -shm ao lado da base
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
     conn = connect(db_path)
-    conn.executescript(SCHEMA)
-    conn.commit()
+    conn.executescript(_SCHEMA_SCRIPT)
     return conn
 
 
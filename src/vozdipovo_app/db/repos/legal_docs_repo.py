@@ -5,7 +5,11 @@ import hashlib
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, List, Optional, Tuple
+
+from vozdipovo_app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,7 +23,52 @@ def _utc_now_iso() -> str:
 
 
 def _sha1(text: str) -> str:
-    return hashlib.sha1(text.encode("utf_8")).hexdigest()
+    return hashlib.sha1(text.encode("utf_8"), usedforsecurity=False).hexdigest()
+
+
+_HAS_URL_SQL = "SELECT 1 FROM legal_docs WHERE url = ? LIMIT 1;"
+_COUNT_RECENT_SQL = """
+SELECT COUNT(1) AS c
+FROM legal_docs
+WHERE site_name = ? AND created_at >= ?;
+"""
+_INSERT_SQL = """
+INSERT OR IGNORE INTO legal_docs(
+  site_name, act_type, title, url, published_at, summary,
+  content_text, raw_html, fetched_at, content_hash, created_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+
+def _doc_params(
+    *,
+    site_name: str,
+    act_type: str,
+    title: str,
+    url: str,
+    published_at: Optional[str],
+    summary: Optional[str],
+    content_text: Optional[str],
+    raw_html: Optional[str],
+    fetched_at: Optional[str] = None,
+    now_iso: str,
+) -> Tuple[Any, ...]:
+    content_text_norm = (content_text or "").strip()
+    content_hash = _sha1(content_text_norm) if content_text_norm else None
+    return (
+        str(site_name),
+        str(act_type),
+        str(title),
+        str(url),
+        published_at,
+        summary,
+        content_text_norm if content_text_norm else None,
+        raw_html,
+        fetched_at or now_iso,
+        content_hash,
+        now_iso,
+    )
 
 
 class LegalDocsRepo:
@@ -53,15 +102,42 @@ class LegalDocsRepo:
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_legal_docs_published_at ON legal_docs(published_at);"
         )
-        self._conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_legal_docs_content_hash ON legal_docs(content_hash);"
-        )
+        has_unique_hash = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='ux_legal_docs_content_hash';"
+        ).fetchone()
+        if has_unique_hash is None:
+            # Migração única: o índice UNIQUE exige que só a linha mais antiga
+            # de cada content_hash fique com o hash
+            cur = self._conn.execute(
+                """
+                UPDATE legal_docs SET content_hash = NULL
+                WHERE content_hash IS NOT NULL
+                  AND id NOT IN (
+                    SELECT MIN(id) FROM legal_docs
+                    WHERE content_hash IS NOT NULL
+                    GROUP BY content_hash
+                  );
+                """
+            )
+            if cur.rowcount > 0:
+                logger.warning(
+                    f"content_hash duplicado limpo em legal_docs, linhas={cur.rowcount}"
+                )
+            self._conn.execute("DROP INDEX IF EXISTS idx_legal_docs_content_hash;")
+            self._conn.execute(
+                "CREATE UNIQUE INDEX ux_legal_docs_content_hash ON legal_docs(content_hash);"
+            )
 
     def has_url(self, url: str) -> bool:
-        row = self._conn.execute(
-            "SELECT 1 FROM legal_docs WHERE url = ? LIMIT 1;", (url,)
-        ).fetchone()
-        return row is not None
+        return self._conn.execute(_HAS_URL_SQL, (url,)).fetchone() is not None
+
+    def _insert_result(self, rowcount: int, url: str) -> InsertResult:
+        if rowcount == 0:
+            # url e content_hash são UNIQUE; só é preciso saber qual disparou
+            if self.has_url(url):
+                return InsertResult(inserted=False, reason="duplicate_url")
+            return InsertResult(inserted=False, reason="duplicate_content_hash")
+        return InsertResult(inserted=True, reason="inserted")
 
     def insert_doc(
         self,
@@ -76,53 +152,51 @@ class LegalDocsRepo:
         raw_html: Optional[str],
         fetched_at: Optional[str] = None,
     ) -> InsertResult:
-        content_text_norm = (content_text or "").strip()
-        content_hash = _sha1(content_text_norm) if content_text_norm else None
-
-        if self.has_url(url):
-            return InsertResult(inserted=False, reason="duplicate_url")
-
-        if content_hash:
-            row = self._conn.execute(
-                "SELECT 1 FROM legal_docs WHERE content_hash = ? LIMIT 1;",
-                (content_hash,),
-            ).fetchone()
-            if row is not None:
-                return InsertResult(inserted=False, reason="duplicate_content_hash")
-
-        self._conn.execute(
-            """
-            INSERT INTO legal_docs(
-              site_name, act_type, title, url, published_at, summary,
-              content_text, raw_html, fetched_at, content_hash, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-            """,
-            (
-                str(site_name),
-                str(act_type),
-                str(title),
-                str(url),
-                published_at,
-                summary,
-                content_text_norm if content_text_norm else None,
-                raw_html,
-                fetched_at or _utc_now_iso(),
-                content_hash,
-                _utc_now_iso(),
-            ),
+        params = _doc_params(
+            site_name=site_name,
+            act_type=act_type,
+            title=title,
+            url=url,
+            published_at=published_at,
+            summary=summary,
+            content_text=content_text,
+            raw_html=raw_html,
+            fetched_at=fetched_at,
+            now_iso=_utc_now_iso(),
         )
-        return InsertResult(inserted=True, reason="inserted")
+        cur = self._conn.execute(_INSERT_SQL, params)
+        return self._insert_result(cur.rowcount, params[3])
+
+    def insert_docs_bulk(self, rows: Iterable[dict[str, Any]]) -> List[InsertResult]:
+        """Insere vários documentos numa única transação.
+
+        Se o chamador já tiver uma transação aberta, os inserts correm dentro
+        dela e o commit fica a cargo do chamador.
+
+        Args:
+            rows: Dicionários com os mesmos argumentos nomeados de insert_doc.
+
+        Returns:
+            List[InsertResult]: Resultado de cada documento, pela ordem de rows.
+        """
+        now_iso = _utc_now_iso()
+        params = [_doc_params(**r, now_iso=now_iso) for r in rows]
+        if self._conn.in_transaction:
+            return self._insert_many(params)
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE;")
+            return self._insert_many(params)
+
+    def _insert_many(self, params: List[Tuple[Any, ...]]) -> List[InsertResult]:
+        cur = self._conn.cursor()
+        results: List[InsertResult] = []
+        for p in params:
+            cur.execute(_INSERT_SQL, p)
+            results.append(self._insert_result(cur.rowcount, p[3]))
+        return results
 
     def count_recent_by_site(self, site_name: str, since_iso: str) -> int:
-        row = self._conn.execute(
-            """
-            SELECT COUNT(1) AS c
-            FROM legal_docs
-            WHERE site_name = ? AND created_at >= ?;
-            """,
-            (site_name, since_iso),
-        ).fetchone()
+        row = self._conn.execute(_COUNT_RECENT_SQL, (site_name, since_iso)).fetchone()
         if row is None:
             return 0
         return int(row["c"] if isinstance(row, sqlite3.Row) else row[0])
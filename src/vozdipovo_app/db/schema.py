@@ -103,6 +103,18 @@ ON news_articles(legal_doc_id);
 CREATE INDEX IF NOT EXISTS idx_news_articles_review_status
 ON news_articles(review_status);
 
+CREATE INDEX IF NOT EXISTS idx_news_articles_legal_doc_status
+ON news_articles(legal_doc_id, review_status);
+
 CREATE INDEX IF NOT EXISTS idx_news_articles_decision
 ON news_articles(decision);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_status_final_score
+ON news_articles(review_status, final_score);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_status_score_editorial
+ON news_articles(review_status, score_editorial);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_publishing_status
+ON news_articles(publishing_status);
 """
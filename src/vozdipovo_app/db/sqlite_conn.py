@@ -6,6 +6,24 @@ from pathlib import Path
 from typing import Union
 
 
+def apply_pragmas(conn: sqlite3.Connection, busy_timeout_ms: int = 30_000) -> None:
+    """Aplica o bloco de PRAGMAs partilhado por todas as ligações da aplicação.
+
+    Args:
+        conn: Ligação acabada de abrir, sem transação pendente.
+        busy_timeout_ms: Tempo de espera por locks, em milissegundos.
+    """
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA foreign_keys=ON;"
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)};"
+    )
+
+
 def connect_sqlite(db_path: Union[str, Path]) -> sqlite3.Connection:
     """Abre ligação SQLite com defaults seguros.
 
@@ -20,7 +38,5 @@ def connect_sqlite(db_path: Union[str, Path]) -> sqlite3.Connection:
 
     conn = sqlite3.connect(str(p))
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
-    conn.execute("PRAGMA journal_mode = WAL;")
-    conn.execute("PRAGMA synchronous = NORMAL;")
+    apply_pragmas(conn)
     return conn
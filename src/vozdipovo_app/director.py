@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Sequence
+
+try:
+    import numpy as np
+except Exception:
+    np = None
 
 from pydantic import BaseModel, Field, conint
 
@@ -101,6 +106,110 @@ def calculate_editorial_score(scores: Dict[str, Any]) -> float:
     return round(_clamp(norm), 2)
 
 
+# Ordem das colunas da matriz usada no cálculo em lote
+SCORE_COLUMNS = (
+    "cv_relevance_score",
+    "scale_score",
+    "impact_score",
+    "novelty_score",
+    "potential_score",
+    "legacy_score",
+    "credibility_score",
+    "positivity_score",
+)
+_SCORE_DEFAULTS = {"positivity_score": 5.0}
+
+
+def scores_to_array(items: Iterable[Dict[str, Any]]) -> Any:
+    """Converte dicionários de scores numa matriz (N, 8) pela ordem de SCORE_COLUMNS.
+
+    Args:
+        items: Dicionários de scores, como os de DirectorScores.
+
+    Returns:
+        Any: np.ndarray float64, ou lista de tuplos se o NumPy não estiver instalado.
+    """
+    rows = [
+        tuple(
+            _to_float(d.get(k, _SCORE_DEFAULTS.get(k, 0)), 0.0) for k in SCORE_COLUMNS
+        )
+        for d in items
+    ]
+    if np is None:
+        return rows
+    return np.array(rows, dtype=np.float64).reshape(-1, len(SCORE_COLUMNS))
+
+
+def _round2(values: Any) -> Any:
+    # np.round escala por 100 e diverge de round() nos casos .xx5
+    return np.fromiter(
+        (round(v, 2) for v in values.tolist()), dtype=np.float64, count=len(values)
+    )
+
+
+def calculate_significance_scores(scores_arr: Any) -> Sequence[float]:
+    """Versão vetorizada de calculate_significance_score.
+
+    Args:
+        scores_arr: Matriz (N, 8) devolvida por scores_to_array.
+
+    Returns:
+        Sequence[float]: Um score por linha, arredondado a 2 casas.
+    """
+    if np is None:
+        return [
+            calculate_significance_score(dict(zip(SCORE_COLUMNS, row)))
+            for row in scores_arr
+        ]
+    a = np.asarray(scores_arr, dtype=np.float64)
+    cv_rel, scale, impact, novelty, potential, legacy, cred = a[:, :7].T
+
+    raw = 0.40 * cv_rel + 0.25 * scale + 0.20 * impact + 0.10 * novelty + 0.05 * cred
+    legacy_mult = 0.7 + 0.3 * (np.clip(legacy, 0.0, 10.0) / 10.0)
+    raw_adj = raw * legacy_mult
+    potential_bonus = 1.0 + 0.1 * (np.clip(potential, 0.0, 10.0) / 10.0)
+    final_raw = raw_adj * potential_bonus
+
+    p = float(get_editorial_config().scoring.significance_power)
+    norm = 10.0 * np.power(np.clip(final_raw, 0.0, 10.0) / 10.0, p)
+    out = np.where(cv_rel < 2.0, cv_rel * 0.5, norm)
+    return _round2(np.clip(out, 0.0, 10.0))
+
+
+def calculate_editorial_scores(scores_arr: Any) -> Sequence[float]:
+    """Versão vetorizada de calculate_editorial_score.
+
+    Args:
+        scores_arr: Matriz (N, 8) devolvida por scores_to_array.
+
+    Returns:
+        Sequence[float]: Um score por linha, arredondado a 2 casas.
+    """
+    if np is None:
+        return [
+            calculate_editorial_score(dict(zip(SCORE_COLUMNS, row)))
+            for row in scores_arr
+        ]
+    a = np.asarray(scores_arr, dtype=np.float64)
+    cv_rel = a[:, 0]
+    impact, novelty, potential, cred, positivity = a[:, [2, 3, 4, 6, 7]].T
+
+    raw = (
+        0.30 * impact
+        + 0.25 * novelty
+        + 0.20 * cred
+        + 0.15 * potential
+        + 0.10 * positivity
+    )
+    p = float(get_editorial_config().scoring.editorial_power)
+    norm = 10.0 * np.power(np.clip(raw, 0.0, 10.0) / 10.0, p)
+
+    penalty_factor = np.maximum(0.1, cv_rel / 15.0)
+    low = (cv_rel * 0.5) * penalty_factor
+    out = np.where(cv_rel < 1.5, low, norm)
+    return _round2(np.clip(out, 0.0, 10.0))
+
+
 def director_assess(
     title: str, body: str, keywords: str, source_name: str
 ) -> DirectorResult:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List
 
 from pydantic import BaseModel, Field, ValidationError
@@ -90,39 +90,46 @@ def revise_article(
     Returns:
         RevisionResult: Resultado estruturado.
     """
+    titulo = str(title or "").strip()
+    texto = str(text_md or "").strip()
+    categoria = str(categoria_tematica or "").strip()
+    sub = str(subcategoria or "").strip()
+
     payload_text = "\n\n".join(
         [
-            f"TITULO: {str(title or '').strip()}",
-            f"TEXTO_COMPLETO:\n{str(text_md or '').strip()}",
+            f"TITULO: {titulo}",
+            f"TEXTO_COMPLETO:\n{texto}",
         ]
     ).strip()
 
+    failed = RevisionResult(
+        revision_status="ERROR",
+        revision_error="",
+        revision_model_used="",
+        titulo_revisto="",
+        texto_completo_md_revisto="",
+        keywords_revistas=[],
+        categoria_tematica=categoria,
+        subcategoria=sub,
+        comentarios_edicao="",
+        checklist_json="{}",
+    )
+
     if not payload_text:
-        return RevisionResult(
-            revision_status="ERROR",
-            revision_error="Texto vazio",
-            revision_model_used="",
-            titulo_revisto="",
-            texto_completo_md_revisto="",
-            keywords_revistas=[],
-            categoria_tematica=str(categoria_tematica or "").strip(),
-            subcategoria=str(subcategoria or "").strip(),
-            comentarios_edicao="",
-            checklist_json="{}",
-        )
+        return replace(failed, revision_error="Texto vazio")
 
     client = get_stage_client_editor()
     res = client.run_json(
         template_vars={
-            "TITULO": str(title or "").strip(),
-            "TEXTO_COMPLETO": str(text_md or "").strip(),
+            "TITULO": titulo,
+            "TEXTO_COMPLETO": texto,
             "KEYWORDS": str(keywords or "").strip(),
             "SITE_NAME": str(site_name or "").strip(),
             "ACT_TYPE": str(act_type or "").strip(),
-            "CATEGORIA_TEMATICA": str(categoria_tematica or "").strip(),
-            "SUBCATEGORIA": str(subcategoria or "").strip(),
+            "CATEGORIA_TEMATICA": categoria,
+            "SUBCATEGORIA": sub,
             "FACTOS_NUCLEARES": json.dumps(
-                [str(x).strip() for x in (factos_nucleares or []) if str(x).strip()],
+                [f for f in (str(x).strip() for x in factos_nucleares or []) if f],
                 ensure_ascii=False,
             ),
         },
@@ -138,33 +145,21 @@ def revise_article(
         corr_id=f"editor:{(title or '')[:40]}",
     )
 
+    model_used = f"{res.provider}:{res.model}".strip(":")
     if not res.ok or not isinstance(res.parsed_json, dict):
-        return RevisionResult(
-            revision_status="ERROR",
+        return replace(
+            failed,
             revision_error=str(res.error or "Falha no editor")[:900],
-            revision_model_used=f"{res.provider}:{res.model}".strip(":"),
-            titulo_revisto="",
-            texto_completo_md_revisto="",
-            keywords_revistas=[],
-            categoria_tematica=str(categoria_tematica or "").strip(),
-            subcategoria=str(subcategoria or "").strip(),
-            comentarios_edicao="",
-            checklist_json="{}",
+            revision_model_used=model_used,
         )
 
     try:
         out = EditorOutput.model_validate(res.parsed_json)
     except ValidationError as e:
-        return RevisionResult(
-            revision_status="ERROR",
+        return replace(
+            failed,
             revision_error=f"JSON inválido: {e}"[:900],
-            revision_model_used=f"{res.provider}:{res.model}".strip(":"),
-            titulo_revisto="",
-            texto_completo_md_revisto="",
-            keywords_revistas=[],
-            categoria_tematica=str(categoria_tematica or "").strip(),
-            subcategoria=str(subcategoria or "").strip(),
-            comentarios_edicao="",
+            revision_model_used=model_used,
             checklist_json=json.dumps(res.parsed_json, ensure_ascii=False)[:2000],
         )
 
@@ -177,11 +172,11 @@ def revise_article(
     return RevisionResult(
         revision_status="OK",
         revision_error="",
-        revision_model_used=f"{res.provider}:{res.model}".strip(":"),
+        revision_model_used=model_used,
         titulo_revisto=out.titulo_revisto.strip(),
         texto_completo_md_revisto=out.texto_completo_md_revisto.strip(),
         keywords_revistas=[
-            str(k).strip() for k in (out.keywords_revistas or []) if str(k).strip()
+            k for k in (str(k).strip() for k in out.keywords_revistas or []) if k
         ],
         categoria_tematica=str(out.categoria_tematica or "").strip(),
         subcategoria=str(out.subcategoria or "").strip(),
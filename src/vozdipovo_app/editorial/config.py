@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -79,9 +80,15 @@ def load_editorial_config_from_path(path: Path) -> EditorialConfig:
         EditorialConfigError: If the file is missing, invalid, or fails validation.
     """
     p = path.expanduser().resolve()
-    if not p.exists():
-        raise EditorialConfigError(f"Editorial config não encontrado: {p}")
+    try:
+        st = p.stat()
+    except OSError:
+        raise EditorialConfigError(f"Editorial config não encontrado: {p}") from None
+    return _load_cached(p, st.st_mtime_ns, st.st_size)
+
 
+@lru_cache(maxsize=8)
+def _load_cached(p: Path, mtime_ns: int, size: int) -> EditorialConfig:
     text = _read_text(p)
     suffix = p.suffix.lower()
 
@@ -177,6 +184,8 @@ def get_editorial_config(force_reload: bool = False) -> EditorialConfig:
         EditorialConfig: Config object.
     """
     global _CACHE
+    if force_reload:
+        _load_cached.cache_clear()
     if _CACHE is None or force_reload:
         _CACHE = _LOADER.load()
     return _CACHE
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import operator
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Mapping
@@ -20,6 +21,27 @@ from vozdipovo_app.llm.errors import (
     parse_retry_after_seconds,
 )
 
+_SESSION_LOCK = threading.Lock()
+_SHARED_SESSION: requests.Session | None = None
+
+
+def _build_session() -> requests.Session:
+    s = requests.Session()
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=2,
+        status=2,
+        backoff_factor=0.6,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("POST",),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
 
 @dataclass(frozen=True, slots=True)
 class HTTPTransport:
@@ -32,25 +54,20 @@ class HTTPTransport:
     timeout_seconds: int
 
     def session(self) -> requests.Session:
-        """Cria uma sessão requests com retries seguros.
+        """Devolve a sessão requests partilhada, com retries seguros.
+
+        A sessão é criada uma vez por processo para reaproveitar ligações
+        keep-alive e sessões TLS entre pedidos.
 
         Returns:
             Sessão configurada.
         """
-        s = requests.Session()
-        retry = Retry(
-            total=2,
-            connect=2,
-            read=2,
-            status=2,
-            backoff_factor=0.6,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=("POST",),
-            raise_on_status=False,
-        )
-        s.mount("https://", HTTPAdapter(max_retries=retry))
-        s.mount("http://", HTTPAdapter(max_retries=retry))
-        return s
+        global _SHARED_SESSION
+        if _SHARED_SESSION is None:
+            with _SESSION_LOCK:
+                if _SHARED_SESSION is None:
+                    _SHARED_SESSION = _build_session()
+        return _SHARED_SESSION
 
     def post_json(
         self,
@@ -184,12 +184,15 @@ class OpenRouterClient:
         if not s:
             raise ValueError("Resposta vazia")
 
-        start = s.find("{")
-        end = s.rfind("}")
-        if start == -1 or end == -1 or end <= start:
-            raise ValueError("JSON não encontrado")
+        if s[0] == "{" and s[-1] == "}":
+            chunk = s
+        else:
+            start = s.find("{")
+            end = s.rfind("}")
+            if start == -1 or end == -1 or end <= start:
+                raise ValueError("JSON não encontrado")
+            chunk = s[start : end + 1]
 
-        chunk = s[start : end + 1]
         obj = json.loads(chunk)
         if not isinstance(obj, dict):
             raise ValueError("JSON não é objeto")
@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from vozdipovo_app.llm.errors import LLMError, LLMNonRetryableError, LLMRetryableError
 from vozdipovo_app.llm.groq_client import GroqClient, GroqConfig
 from vozdipovo_app.llm.openrouter_client import OpenRouterClient, OpenRouterConfig
@@ -305,21 +309,33 @@ class JsonRunResult:
     error: str
 
 
+_DECODER = json.JSONDecoder()
+
+
 def _extract_json_object(text: str) -> Dict[str, Any] | None:
     s = str(text or "").strip()
     if not s:
         return None
     try:
-        obj = json.loads(s)
+        obj = orjson.loads(s) if orjson is not None else json.loads(s)
         return obj if isinstance(obj, dict) else None
     except Exception:
         pass
 
-    m = re.search(r"\{[\s\S]*\}", s)
-    if not m:
+    start = s.find("{")
+    if start == -1:
+        return None
+    try:
+        obj, _ = _DECODER.raw_decode(s, start)
+        return obj if isinstance(obj, dict) else None
+    except ValueError:
+        pass
+
+    end = s.rfind("}")
+    if end <= start:
         return None
     try:
-        obj = json.loads(m.group(0))
+        obj = json.loads(s[start : end + 1])
         return obj if isinstance(obj, dict) else None
     except Exception:
         return None
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -11,11 +13,34 @@ from vozdipovo_app.editorial.models import ModelPool
 from vozdipovo_app.llm.router import LLMRouter
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
 def _apply_template(text: str, template_vars: dict[str, str]) -> str:
-    out = text
-    for k, v in template_vars.items():
-        out = out.replace("{{" + k + "}}", str(v or ""))
-    return out
+    def _sub(m: re.Match[str]) -> str:
+        key = m.group(1)
+        if key not in template_vars:
+            return m.group(0)
+        return str(template_vars[key] or "")
+
+    return _PLACEHOLDER_RE.sub(_sub, text)
+
+
+@lru_cache(maxsize=16)
+def _read_prompt_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_prompt(path: Path) -> str:
+    """Lê o prompt, relendo o ficheiro apenas quando o mtime muda.
+
+    Args:
+        path: Caminho do ficheiro de prompt.
+
+    Returns:
+        str: Conteúdo do prompt.
+    """
+    return _read_prompt_cached(str(path), path.stat().st_mtime_ns)
 
 
 def _filter_allowed_keys(
@@ -86,8 +111,7 @@ class LlmStageClient:
         chosen_path = str(
             prompt_path_override or prompt_path or self._prompt_path_default
         )
-        p = Path(chosen_path)
-        prompt_raw = p.read_text(encoding="utf-8")
+        prompt_raw = _read_prompt(Path(chosen_path))
         prompt = _apply_template(prompt_raw, template_vars)
 
         res = self._router.run_json(
@@ -4,9 +4,9 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence, Set
+from typing import List, Sequence, Set, Tuple
 
-from vozdipovo_app.audio_generator import gerar_audio_para_artigo
+from vozdipovo_app.audio_generator import gerar_audio_para_artigos
 from vozdipovo_app.modules.base import Stage, StageContext
 from vozdipovo_app.utils.logger import get_logger
 
@@ -51,7 +51,7 @@ class AudioStage(Stage):
             (self.limit,),
         ).fetchall()
 
-        done = 0
+        pending: List[Tuple[int, str]] = []
         for r in rows:
             legal_doc_id = int(r["legal_doc_id"])
             highlight_type = str(r["highlight_type"] or "").strip().upper()
@@ -75,9 +75,20 @@ class AudioStage(Stage):
                 continue
 
             texto_audio = f"{titulo}. {corpo}" if titulo else corpo
-            fp = gerar_audio_para_artigo(
-                texto_audio, str(out_dir), f"article_{legal_doc_id}"
-            )
+            pending.append((legal_doc_id, texto_audio))
+
+        if not pending:
+            return 0
+
+        paths = gerar_audio_para_artigos(
+            [
+                (texto_audio, str(out_dir), f"article_{legal_doc_id}")
+                for legal_doc_id, texto_audio in pending
+            ]
+        )
+
+        done = 0
+        for (legal_doc_id, _), fp in zip(pending, paths):
             if fp:
                 conn.execute(
                     "UPDATE news_articles SET audio_filepath=? WHERE legal_doc_id=?",
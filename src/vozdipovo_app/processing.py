@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Optional
@@ -12,13 +13,16 @@ from vozdipovo_app.database import (
     ensure_db,
     insert_row,
     sha256_text,
-    update_row_response,
+    update_rows_response,
 )
 from vozdipovo_app.formatter import build_user_prompt, format_chat_prompt
 from vozdipovo_app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_FLUSH_EVERY = 50
+_FLUSH_SECONDS = 30.0
+
 
 @dataclass(frozen=True, slots=True)
 class BatchStats:
@@ -85,89 +89,104 @@ def process_batch(
         return BatchStats(ok=0, error=0, skip=0).as_dict()
 
     stats = BatchStats(ok=0, error=0, skip=0)
-
-    for path in files:
-        content = path.read_text(encoding="utf8")
-        file_hash = sha256_text(f"{path.name}|{content}")
-        mtime = path.stat().st_mtime
-        created_at = dt.datetime.fromtimestamp(mtime).isoformat(timespec="seconds")
-
-        if (not reprocess) and already_processed(conn, file_hash):
-            logger.info(f"Skip, já processado, file={path.name}")
-            stats = BatchStats(ok=stats.ok, error=stats.error, skip=stats.skip + 1)
-            continue
-
-        messages: list[dict[str, str]] = []
-        sys_msg = str(cfg.get("system_message") or "")
-        if sys_msg:
-            messages.append({"role": "system", "content": sys_msg})
-
-        user_content = build_user_prompt(instructions, content)
-        messages.append({"role": "user", "content": user_content})
-
-        formatted_prompt = format_chat_prompt(
-            messages, enable_thinking=bool(cfg.get("thinking", False))
-        )
-
-        if reprocess and already_processed(conn, file_hash):
-            conn.execute("DELETE FROM processed_texts WHERE file_hash = ?", (file_hash,))
-            conn.commit()
-
-        api_cfg = cfg.get("api", {})
-        row = {
-            "filename": path.name,
-            "created_at": created_at,
-            "file_mtime": mtime,
-            "file_hash": file_hash,
-            "content_text": content,
-            "prompt_used": formatted_prompt,
-            "response_text": None,
-            "status": "pending",
-            "error": None,
-            "model": api_cfg.get("model", ""),
-            "api_version": api_cfg.get("version", ""),
-            "temperature": float(api_cfg.get("temperature", 0.0)),
-            "top_p": float(api_cfg.get("top_p", 1.0)),
-            "max_tokens": int(api_cfg.get("max_tokens", 0)),
-            "usage_prompt_tokens": None,
-            "usage_completion_tokens": None,
-            "usage_total_tokens": None,
-        }
-        row_id = insert_row(conn, row)
-
-        try:
-            data = call_publicai(
-                api_key=str(cfg.get("api_key", "")),
-                model=str(row["model"]),
-                prompt=formatted_prompt,
-                max_tokens=int(row["max_tokens"]),
-                temperature=float(row["temperature"]),
-                top_p=float(row["top_p"]),
-                api_version=str(row["api_version"]),
-                user_agent=str(api_cfg.get("user_agent", "")),
+    # Cada insert é gravado antes da chamada à API, a linha pending fica
+    # durável. Os updates de resposta ficam em memória e são gravados num só
+    # commit a cada _FLUSH_EVERY ficheiros ou _FLUSH_SECONDS, e no fim.
+    pending: list[tuple[int, Optional[str], str, Optional[dict], Optional[str]]] = []
+    last_flush = time.monotonic()
+
+    try:
+        for path in files:
+            content = path.read_text(encoding="utf8")
+            file_hash = sha256_text(f"{path.name}|{content}")
+            mtime = path.stat().st_mtime
+            created_at = dt.datetime.fromtimestamp(mtime).isoformat(timespec="seconds")
+
+            if (not reprocess) and already_processed(conn, file_hash):
+                logger.info(f"Skip, já processado, file={path.name}")
+                stats = BatchStats(ok=stats.ok, error=stats.error, skip=stats.skip + 1)
+                continue
+
+            messages: list[dict[str, str]] = []
+            sys_msg = str(cfg.get("system_message") or "")
+            if sys_msg:
+                messages.append({"role": "system", "content": sys_msg})
+
+            user_content = build_user_prompt(instructions, content)
+            messages.append({"role": "user", "content": user_content})
+
+            formatted_prompt = format_chat_prompt(
+                messages, enable_thinking=bool(cfg.get("thinking", False))
             )
-            assistant_text = data["choices"][0]["message"]["content"]
-            usage = data.get("usage", {})
-            update_row_response(conn, row_id, assistant_text, status="ok", usage=usage, error=None)
-            logger.info(f"Ok, file={path.name}")
-            stats = BatchStats(ok=stats.ok + 1, error=stats.error, skip=stats.skip)
-
-            if export_md:
-                from vozdipovo_app.exporter import export_markdown_one
-
-                export_markdown_one(
-                    out_dir=out_md,
-                    filename=path.name,
-                    original_text=content,
-                    response_text=assistant_text,
-                    prompt_used=formatted_prompt,
+
+            if reprocess and already_processed(conn, file_hash):
+                conn.execute(
+                    "DELETE FROM processed_texts WHERE file_hash = ?", (file_hash,)
                 )
 
-        except Exception as e:
-            update_row_response(
-                conn, row_id, response_text=None, status="error", usage=None, error=str(e)
-            )
-            logger.error(f"Erro, file={path.name}, err={e}", exc_info=True)
-            stats = BatchStats(ok=stats.ok, error=stats.error + 1, skip=stats.skip)
+            api_cfg = cfg.get("api", {})
+            row = {
+                "filename": path.name,
+                "created_at": created_at,
+                "file_mtime": mtime,
+                "file_hash": file_hash,
+                "content_text": content,
+                "prompt_used": formatted_prompt,
+                "response_text": None,
+                "status": "pending",
+                "error": None,
+                "model": api_cfg.get("model", ""),
+                "api_version": api_cfg.get("version", ""),
+                "temperature": float(api_cfg.get("temperature", 0.0)),
+                "top_p": float(api_cfg.get("top_p", 1.0)),
+                "max_tokens": int(api_cfg.get("max_tokens", 0)),
+                "usage_prompt_tokens": None,
+                "usage_completion_tokens": None,
+                "usage_total_tokens": None,
+            }
+            row_id = insert_row(conn, row)
+
+            try:
+                data = call_publicai(
+                    api_key=str(cfg.get("api_key", "")),
+                    model=str(row["model"]),
+                    prompt=formatted_prompt,
+                    max_tokens=int(row["max_tokens"]),
+                    temperature=float(row["temperature"]),
+                    top_p=float(row["top_p"]),
+                    api_version=str(row["api_version"]),
+                    user_agent=str(api_cfg.get("user_agent", "")),
+                )
+                assistant_text = data["choices"][0]["message"]["content"]
+                usage = data.get("usage", {})
+                pending.append((row_id, assistant_text, "ok", usage, None))
+                logger.info(f"Ok, file={path.name}")
+                stats = BatchStats(ok=stats.ok + 1, error=stats.error, skip=stats.skip)
+
+                if export_md:
+                    from vozdipovo_app.exporter import export_markdown_one
+
+                    export_markdown_one(
+                        out_dir=out_md,
+                        filename=path.name,
+                        original_text=content,
+                        response_text=assistant_text,
+                        prompt_used=formatted_prompt,
+                    )
+
+            except Exception as e:
+                pending.append((row_id, None, "error", None, str(e)))
+                logger.error(f"Erro, file={path.name}, err={e}", exc_info=True)
+                stats = BatchStats(ok=stats.ok, error=stats.error + 1, skip=stats.skip)
+
+            if (
+                len(pending) >= _FLUSH_EVERY
+                or time.monotonic() - last_flush >= _FLUSH_SECONDS
+            ):
+                update_rows_response(conn, pending)
+                pending.clear()
+                last_flush = time.monotonic()
+    finally:
+        update_rows_response(conn, pending)
 
     return stats.as_dict()
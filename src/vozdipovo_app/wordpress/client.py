@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import base64
 import os
+import threading
 import time
 from dataclasses import dataclass
 from functools import lru_cache
@@ -41,6 +42,7 @@ class WPConfig:
         default_status: Default post status.
         timeout: Request timeout in seconds.
         rate_sleep: Minimum seconds between requests.
+        pool_maxsize: Keep-alive connections kept per host.
     """
 
     base_url: str
@@ -49,6 +51,7 @@ class WPConfig:
     default_status: str = "publish"
     timeout: int = 30
     rate_sleep: float = 0.6
+    pool_maxsize: int = 10
 
 
 def _basic_auth_header(username: str, app_password: str) -> str:
@@ -67,7 +70,7 @@ def _make_retry() -> Retry:
         status=3,
         backoff_factor=0.6,
         status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=("GET", "POST", "PUT"),
+        allowed_methods=("GET", "POST", "PUT", "DELETE"),
         raise_on_status=False,
         respect_retry_after_header=True,
     )
@@ -83,7 +86,9 @@ class WPClient:
         self._cfg = cfg
         self._session = requests.Session()
 
-        adapter = HTTPAdapter(max_retries=_make_retry())
+        adapter = HTTPAdapter(
+            pool_maxsize=int(cfg.pool_maxsize), max_retries=_make_retry()
+        )
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
 
@@ -180,6 +185,12 @@ class WPClient:
             "PUT", path, json_payload=json, headers=headers, timeout=timeout
         )
 
+    def delete(self, path: str, **kw: Any) -> Any:
+        """Perform a DELETE request."""
+        params = kw.pop("params", None)
+        timeout = kw.pop("timeout", None)
+        return self._request_json("DELETE", path, params=params, timeout=timeout)
+
     def create_post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a WordPress post."""
         data = self.post("/wp-json/wp/v2/posts", json=payload)
@@ -304,13 +315,19 @@ def _dedupe_preserve_order(items: Iterable[str]) -> List[str]:
 
 
 class WordPressClient:
-    """High level WordPress client used by the publishing pipeline."""
+    """High level WordPress client used by the publishing pipeline.
+
+    Safe to share between threads: the request throttle and the tag cache
+    are guarded by locks.
+    """
 
     def __init__(self, cfg: Optional[WPConfig] = None) -> None:
         self._cfg = cfg or _default_wp_config()
         self._client = WPClient(self._cfg)
         self._tag_cache: Dict[str, int] = {}
+        self._tag_lock = threading.Lock()
         self._last_request_at = 0.0
+        self._throttle_lock = threading.Lock()
 
     @property
     def cfg(self) -> WPConfig:
@@ -321,11 +338,11 @@ class WordPressClient:
         minimum = float(self._cfg.rate_sleep)
         if minimum <= 0:
             return
-        now = time.monotonic()
-        elapsed = now - self._last_request_at
-        if elapsed < minimum:
-            time.sleep(minimum - elapsed)
-        self._last_request_at = time.monotonic()
+        with self._throttle_lock:
+            elapsed = time.monotonic() - self._last_request_at
+            if elapsed < minimum:
+                time.sleep(minimum - elapsed)
+            self._last_request_at = time.monotonic()
 
     def create_post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         self._throttle()
@@ -367,10 +384,14 @@ class WordPressClient:
 
         from vozdipovo_app.wordpress.taxonomies import get_or_create_term
 
-        self._throttle()
-        term = get_or_create_term(self._client, "tags", str(name).strip())
-        if term is None:
-            logger.warning(f"Falha ao resolver tag: {name}")
-            return None
-        self._tag_cache[key] = int(term.id)
-        return int(term.id)
+        # Re-check under the lock so two workers never create the same tag
+        with self._tag_lock:
+            if key in self._tag_cache:
+                return self._tag_cache[key]
+            self._throttle()
+            term = get_or_create_term(self._client, "tags", str(name).strip())
+            if term is None:
+                logger.warning(f"Falha ao resolver tag: {name}")
+                return None
+            self._tag_cache[key] = int(term.id)
+            return int(term.id)
@@ -15,12 +15,13 @@ def upsert_post(
     subcategoria: str = "",
     existing_post_id: Optional[int] = None,
     default_status: str = "publish",
+    client: Optional[WordPressClient] = None,
 ) -> Tuple[int, str]:
     categoria = sanitize_category(categoria_tematica)
     cat_id = resolve_category_id(categoria)
     tags = _normalize_tags(keywords)
 
-    client = WordPressClient()
+    client = client or WordPressClient()
     payload: Dict[str, Any] = {
         "title": title,
         "content": content_md,
@@ -0,0 +1,22 @@
+#!filepath: tests/test_article_reviser.py
+from __future__ import annotations
+
+import pytest
+
+from vozdipovo_app.article_reviser import _build_rotator
+
+
+def test_rotator_is_fresh_per_article(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GROQ_API_KEY", "chave-a")
+    first = _build_rotator(("modelo-x",), 30.0)
+    second = _build_rotator(("modelo-x",), 30.0)
+
+    assert first is not second
+    assert first.groq is second.groq
+    assert first.models == second.models
+    assert first.models is not second.models
+
+    monkeypatch.setenv("GROQ_API_KEY", "chave-b")
+    third = _build_rotator(("modelo-x",), 30.0)
+    assert third.groq is not first.groq
+    assert third.groq.settings.groq_api_key == "chave-b"
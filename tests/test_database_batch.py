@@ -0,0 +1,51 @@
+#!filepath: tests/test_database_batch.py
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from vozdipovo_app.database import ensure_db, insert_row, update_rows_response
+
+
+def _row(name: str) -> dict:
+    return {
+        "filename": name,
+        "created_at": "2024-01-01T00:00:00",
+        "file_mtime": 0.0,
+        "file_hash": f"hash-{name}",
+        "content_text": "texto",
+        "prompt_used": "prompt",
+        "status": "pending",
+    }
+
+
+def test_update_rows_response_writes_all_updates_in_one_commit(tmp_path: Path) -> None:
+    db = tmp_path / "db" / "processed.sqlite"
+    conn = ensure_db(str(db))
+    ok_id = insert_row(conn, _row("a.txt"))
+    err_id = insert_row(conn, _row("b.txt"))
+    assert not conn.in_transaction
+
+    usage = {"prompt_tokens": 3, "completion_tokens": 5, "total_tokens": 8}
+    n = update_rows_response(
+        conn,
+        [(ok_id, "resposta", "ok", usage, None), (err_id, None, "error", None, "boom")],
+    )
+    assert n == 2
+    assert not conn.in_transaction
+
+    other = sqlite3.connect(str(db))
+    try:
+        rows = other.execute(
+            "SELECT filename, response_text, status, error, usage_prompt_tokens,"
+            " usage_completion_tokens, usage_total_tokens"
+            " FROM processed_texts ORDER BY id"
+        ).fetchall()
+    finally:
+        other.close()
+        conn.close()
+
+    assert rows == [
+        ("a.txt", "resposta", "ok", None, 3, 5, 8),
+        ("b.txt", None, "error", "boom", None, None, None),
+    ]
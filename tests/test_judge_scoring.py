@@ -87,3 +87,33 @@ def test_significance_power_changes_score(
     s2 = calculate_significance_score(scores)
 
     assert s2 < s1
+
+
+def test_batch_scores_match_scalar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from vozdipovo_app.director import (
+        calculate_editorial_score,
+        calculate_editorial_scores,
+        calculate_significance_scores,
+        scores_to_array,
+    )
+
+    p = tmp_path / "c.json"
+    _write(p, _config_with_power(1.5))
+    monkeypatch.setenv("EDITORIAL_CONFIG_PATH", str(p))
+    get_editorial_config(force_reload=True)
+
+    items = [
+        {"cv_relevance_score": v, "scale_score": 3, "impact_score": v}
+        for v in (0, 1, 1.4, 1.9, 2, 5, 7.5, 10)
+    ]
+    items += [{"cv_relevance_score": 0.3, "impact_score": 9}, {}]
+    arr = scores_to_array(items)
+
+    assert [float(x) for x in calculate_significance_scores(arr)] == [
+        calculate_significance_score(it) for it in items
+    ]
+    assert [float(x) for x in calculate_editorial_scores(arr)] == [
+        calculate_editorial_score(it) for it in items
+    ]
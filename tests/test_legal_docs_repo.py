@@ -0,0 +1,109 @@
+#!filepath: tests/test_legal_docs_repo.py
+from __future__ import annotations
+
+import sqlite3
+
+from vozdipovo_app.db.repos.legal_docs_repo import LegalDocsRepo
+
+
+def _doc(url: str, content_text: str) -> dict:
+    return {
+        "site_name": "bo",
+        "act_type": "decreto",
+        "title": "Título",
+        "url": url,
+        "published_at": None,
+        "summary": None,
+        "content_text": content_text,
+        "raw_html": None,
+    }
+
+
+def test_insert_docs_bulk_leaves_caller_transaction_open() -> None:
+    conn = sqlite3.connect(":memory:")
+    repo = LegalDocsRepo(conn)
+    repo.ensure_columns()
+    conn.commit()
+
+    repo.insert_doc(**_doc("https://a", "texto a"))
+    assert conn.in_transaction
+
+    results = repo.insert_docs_bulk(
+        [_doc("https://b", "texto b"), _doc("https://a", "outro")]
+    )
+    assert [r.reason for r in results] == ["inserted", "duplicate_url"]
+    assert conn.in_transaction
+
+    conn.rollback()
+    assert conn.execute("SELECT COUNT(*) FROM legal_docs").fetchone()[0] == 0
+
+
+def test_insert_docs_bulk_commits_its_own_transaction(tmp_path) -> None:
+    db = tmp_path / "docs.sqlite"
+    conn = sqlite3.connect(str(db))
+    repo = LegalDocsRepo(conn)
+    repo.ensure_columns()
+    conn.commit()
+
+    results = repo.insert_docs_bulk(
+        [_doc("https://a", "mesmo texto"), _doc("https://b", "mesmo texto")]
+    )
+    assert [r.reason for r in results] == ["inserted", "duplicate_content_hash"]
+    assert not conn.in_transaction
+
+    other = sqlite3.connect(str(db))
+    try:
+        assert other.execute("SELECT COUNT(*) FROM legal_docs").fetchone()[0] == 1
+    finally:
+        other.close()
+        conn.close()
+
+
+def test_ensure_columns_keeps_oldest_duplicate_hash(caplog) -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE legal_docs (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          site_name TEXT NOT NULL,
+          act_type TEXT NOT NULL,
+          title TEXT NOT NULL,
+          url TEXT NOT NULL UNIQUE,
+          published_at TEXT,
+          summary TEXT,
+          content_text TEXT,
+          raw_html TEXT,
+          fetched_at TEXT,
+          content_hash TEXT,
+          created_at TEXT
+        );
+        """)
+    conn.executemany(
+        "INSERT INTO legal_docs(site_name, act_type, title, url, content_hash)"
+        " VALUES ('bo', 'decreto', 't', ?, ?)",
+        [
+            ("https://a", "h1"),
+            ("https://b", "h1"),
+            ("https://c", "h2"),
+            ("https://d", "h1"),
+        ],
+    )
+    conn.commit()
+
+    repo = LegalDocsRepo(conn)
+    with caplog.at_level("WARNING"):
+        repo.ensure_columns()
+    assert "linhas=2" in caplog.text
+
+    rows = conn.execute(
+        "SELECT url, content_hash FROM legal_docs ORDER BY id"
+    ).fetchall()
+    assert rows == [
+        ("https://a", "h1"),
+        ("https://b", None),
+        ("https://c", "h2"),
+        ("https://d", None),
+    ]
+
+    caplog.clear()
+    repo.ensure_columns()
+    assert caplog.text == ""